@@ -11,6 +11,7 @@ Usage:
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
 from swimcuttimes import configure_logging, get_logger
 from swimcuttimes.api.routes import (
@@ -56,6 +57,9 @@ def create_app() -> FastAPI:
         redoc_url="/redoc" if not settings.is_production else None,
     )
 
+    # Compress larger JSON payloads (list endpoints); clients send Accept-Encoding
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+
     # Register routes
     app.include_router(health_router)
     app.include_router(auth_router, prefix="/api/v1")
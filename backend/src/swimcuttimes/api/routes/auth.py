@@ -3,7 +3,7 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel, EmailStr
 from supabase_auth.types import (
     SignInWithEmailAndPasswordCredentials,
@@ -13,6 +13,7 @@ from supabase_auth.types import (
 from swimcuttimes import get_logger
 from swimcuttimes.api.auth import AdminUser, CurrentUser
 from swimcuttimes.api.dependencies import SupabaseDep
+from swimcuttimes.dao.base import escape_like, uuid_prefix_bounds
 from swimcuttimes.models import (
     Invitation,
     InvitationCreate,
@@ -358,12 +359,27 @@ async def create_invitation(
 
 
 @router.get("/invitations", response_model=list[Invitation])
-async def list_invitations(user: CurrentUser, client: SupabaseDep) -> list[Invitation]:
+async def list_invitations(
+    user: CurrentUser,
+    client: SupabaseDep,
+    email: str | None = Query(None, description="Exact email (case-insensitive)"),
+    id_prefix: str | None = Query(
+        None, pattern=r"^[0-9a-fA-F-]{1,36}$", description="Leading characters of the ID"
+    ),
+) -> list[Invitation]:
     """List invitations sent by current user (admins see all)."""
     query = client.table("invitations").select("*").order("created_at", desc=True)
 
     if not user.is_admin:
         query = query.eq("inviter_id", str(user.id))
+    if email:
+        query = query.ilike("email", escape_like(email))
+    if id_prefix:
+        try:
+            low, high = uuid_prefix_bounds(id_prefix)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        query = query.gte("id", low).lte("id", high)
 
     result = query.execute()
 
@@ -143,6 +143,9 @@ def list_meets(
     user: CurrentUser,
     dao: MeetDAODep,
     name: str | None = Query(None, description="Partial name match"),
+    id_prefix: str | None = Query(
+        None, pattern=r"^[0-9a-fA-F-]{1,36}$", description="Leading characters of the ID"
+    ),
     course: Course | None = None,
     meet_type: MeetType | None = None,
     sanctioning_body: str | None = Query(None, description="e.g., 'USA Swimming', 'MIAA'"),
@@ -152,16 +155,20 @@ def list_meets(
     limit: int = Query(100, ge=1, le=500),
 ) -> list[Meet]:
     """Search meets with optional filters."""
-    return dao.search(
-        name=name,
-        course=course,
-        meet_type=meet_type,
-        sanctioning_body=sanctioning_body,
-        start_after=start_after,
-        start_before=start_before,
-        indoor=indoor,
-        limit=limit,
-    )
+    try:
+        return dao.search(
+            name=name,
+            course=course,
+            meet_type=meet_type,
+            sanctioning_body=sanctioning_body,
+            start_after=start_after,
+            start_before=start_before,
+            indoor=indoor,
+            limit=limit,
+            id_prefix=id_prefix,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
 
 # =============================================================================
@@ -160,19 +160,32 @@ def list_swimmers(
     user: CurrentUser,
     dao: SwimmerDAODep,
     name: str | None = Query(None, description="Search in first or last name"),
+    name_exact: bool = Query(
+        False, description='Match "First Last", "Last, First" or last name exactly'
+    ),
+    id_prefix: str | None = Query(
+        None, pattern=r"^[0-9a-fA-F-]{1,36}$", description="Leading characters of the ID"
+    ),
+    usa_swimming_id: str | None = Query(None, description="Exact USA Swimming ID"),
     gender: Gender | None = Query(None, description="Filter by gender"),
     min_age: int | None = Query(None, description="Minimum age"),
     max_age: int | None = Query(None, description="Maximum age"),
     limit: int = Query(100, ge=1, le=500),
 ) -> list[SwimmerResponse]:
     """Search swimmers with optional filters."""
-    swimmers = dao.search(
-        name=name,
-        gender=gender,
-        min_age=min_age,
-        max_age=max_age,
-        limit=limit,
-    )
+    try:
+        swimmers = dao.search(
+            name=name,
+            gender=gender,
+            min_age=min_age,
+            max_age=max_age,
+            limit=limit,
+            name_exact=name_exact,
+            id_prefix=id_prefix,
+            usa_swimming_id=usa_swimming_id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     return [SwimmerResponse.from_swimmer(s) for s in swimmers]
 
 
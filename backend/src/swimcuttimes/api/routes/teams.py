@@ -139,6 +139,10 @@ def list_teams(
     user: CurrentUser,
     dao: TeamDAODep,
     name: str | None = Query(None, description="Partial name match"),
+    name_exact: bool = Query(False, description="Match the full name (case-insensitive)"),
+    id_prefix: str | None = Query(
+        None, pattern=r"^[0-9a-fA-F-]{1,36}$", description="Leading characters of the ID"
+    ),
     team_type: TeamType | None = None,
     sanctioning_body: str | None = Query(None, description="e.g., 'USA Swimming', 'NCAA D1'"),
     lsc: str | None = Query(None, description="LSC code for club teams"),
@@ -149,17 +153,22 @@ def list_teams(
     offset: int = Query(0, ge=0),
 ) -> list[Team]:
     """Search teams with optional filters."""
-    return dao.search(
-        name=name,
-        team_type=team_type,
-        sanctioning_body=sanctioning_body,
-        lsc=lsc,
-        division=division,
-        state=state,
-        country=country,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        return dao.search(
+            name=name,
+            team_type=team_type,
+            sanctioning_body=sanctioning_body,
+            lsc=lsc,
+            division=division,
+            state=state,
+            country=country,
+            limit=limit,
+            offset=offset,
+            name_exact=name_exact,
+            id_prefix=id_prefix,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
 
 # =============================================================================
@@ -6,11 +6,11 @@ All endpoints require authentication (invite-only app).
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from swimcuttimes.api.auth import AdminUser, CurrentUser
 from swimcuttimes.api.dependencies import TimeStandardDAODep
-from swimcuttimes.models import Course, Gender, Stroke, TimeStandard
+from swimcuttimes.models import Course, Event, Gender, Stroke, TimeStandard
 
 router = APIRouter(prefix="/time-standards", tags=["time-standards"])
 
@@ -82,6 +82,57 @@ def create_time_standard(
         raise HTTPException(status_code=500, detail=f"Failed to create time standard: {e}") from e
 
 
+class TimeStandardBulkCreate(BaseModel):
+    """Request body for creating many time standards at once."""
+
+    standards: list[TimeStandardCreate] = Field(..., min_length=1, max_length=500)
+
+
+@router.post("/bulk", response_model=list[TimeStandard], status_code=status.HTTP_201_CREATED)
+def bulk_create_time_standards(
+    data: TimeStandardBulkCreate,
+    user: AdminUser,  # Admin only
+    dao: TimeStandardDAODep,
+) -> list[TimeStandard]:
+    """Create many time standards in one request (admin only).
+
+    The standards are inserted in one statement, so either all of them are
+    created or none are. Events they need are created first and are kept even
+    if the insert fails.
+    """
+    from swimcuttimes import get_logger
+
+    logger = get_logger(__name__)
+
+    try:
+        standards = [
+            TimeStandard(
+                event=Event(
+                    stroke=item.event.stroke,
+                    distance=item.event.distance,
+                    course=item.event.course,
+                ),
+                gender=item.gender,
+                age_group=item.age_group,
+                standard_name=item.standard_name,
+                cut_level=item.cut_level,
+                sanctioning_body=item.sanctioning_body,
+                time_centiseconds=item.time_centiseconds,
+                effective_year=item.effective_year,
+            )
+            for item in data.standards
+        ]
+        results = dao.bulk_create(standards)
+        logger.info("time_standards_bulk_created", count=len(results))
+        return results
+    except ValueError as e:
+        logger.warning("time_standards_bulk_create_failed", error=str(e), count=len(data.standards))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error("time_standards_bulk_create_error", error=str(e), count=len(data.standards))
+        raise HTTPException(status_code=500, detail=f"Failed to create time standards: {e}") from e
+
+
 @router.get("", response_model=list[TimeStandard])
 def list_time_standards(
     user: CurrentUser,  # Requires auth
@@ -9,16 +9,25 @@ Usage:
     swimcuttimes invite create coach user@example.com
 """
 
+import contextlib
 import os
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import quote, urlencode
 
 import typer
 from dotenv import load_dotenv
 
-# Load .env file for API keys, etc.
-load_dotenv()
+# Load .env file for API keys, etc. Skipped during shell completion, and in child
+# processes that inherited an environment we already loaded.
+if not os.environ.get("_SWIMCUTTIMES_COMPLETE") and not os.environ.get("SWIMCUT_ENV_LOADED"):
+    load_dotenv(override=False)
+    os.environ["SWIMCUT_ENV_LOADED"] = "1"
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
 from swimcuttimes.cli import auth as cli_auth
 
@@ -30,6 +39,170 @@ app = typer.Typer(
 )
 
 
+# =============================================================================
+# RESPONSE HELPERS
+# =============================================================================
+
+
+def _status(message: str) -> contextlib.AbstractContextManager:
+    """Show a spinner while waiting on the API, when there is a terminal to show it on.
+
+    Piped or scripted runs (or SWIMCUT_NO_SPINNER=1) skip Rich's live-render
+    thread entirely.
+    """
+    if console.is_terminal and os.environ.get("SWIMCUT_NO_SPINNER") != "1":
+        return console.status(message)
+    return contextlib.nullcontext()
+
+
+def _error_detail(response) -> str:
+    """Extract the API error detail from a response, falling back to raw text."""
+    try:
+        return cli_auth.json_loads(response.content).get("detail", response.text)
+    except Exception:
+        return response.text
+
+
+def _check_status(response, expect: int, messages: dict[int, str] | None = None) -> None:
+    """Exit with an error unless the response has the expected status code.
+
+    Args:
+        response: API response
+        expect: Success status code
+        messages: Error message per status code. "{detail}" in a message is
+            replaced with the API's error detail (the body is decoded at most once).
+
+    Raises:
+        typer.Exit: If the status code does not match
+    """
+    if response.status_code == expect:
+        return
+
+    msg = (messages or {}).get(response.status_code, "Error: {detail}")
+    if "{detail}" in msg:
+        msg = msg.format(detail=_error_detail(response))
+    console.print(f"[red]{msg}[/red]")
+    raise typer.Exit(1)
+
+
+# =============================================================================
+# RESOLVER HELPERS
+# =============================================================================
+
+# Characters of a lowercased UUID
+_UUID_CHARS = frozenset("0123456789abcdef-")
+
+
+def _is_id_prefix(ident_lower: str) -> bool:
+    """Check if a lowercased identifier looks like a partial UUID (min 8 hex digits)."""
+    return len(ident_lower) - ident_lower.count("-") >= 8 and _UUID_CHARS.issuperset(ident_lower)
+
+
+def _is_canonical_uuid(ident_lower: str) -> bool:
+    """Check if a lowercased identifier is a full 8-4-4-4-12 UUID."""
+    return (
+        len(ident_lower) == 36
+        and ident_lower[8] == ident_lower[13] == ident_lower[18] == ident_lower[23] == "-"
+        and ident_lower.count("-") == 4
+        and _UUID_CHARS.issuperset(ident_lower)
+    )
+
+
+def _resolve_entity(
+    identifier: str,
+    *,
+    resource: str,
+    name_limit: int,
+    name_matches: Callable[[dict, str], bool],
+    describe: Callable[[dict], str],
+) -> dict | None:
+    """Resolve an entity by full UUID, partial UUID (min 8 hex digits) or exact name.
+
+    Args:
+        identifier: UUID, partial UUID or name as typed by the user
+        resource: API collection, e.g. "teams" (also used in messages)
+        name_limit: Rows to request for the name search (enough to detect ambiguity)
+        name_matches: Whether an entity's name matches the casefolded identifier.
+            Guards against servers without name_exact, which fall back to partial match.
+        describe: Short label for an entity in ambiguity listings
+
+    Returns:
+        The entity dict, or None if nothing matched
+
+    Raises:
+        typer.Exit: If a lookup fails or the identifier is ambiguous
+    """
+    ident_lower = identifier.lower()
+
+    # A full UUID can be fetched directly
+    if _is_canonical_uuid(ident_lower):
+        response = cli_auth.api_request("GET", f"/api/v1/{resource}/{ident_lower}")
+        if response.status_code == 200:
+            return response.json()
+        # Fall through to try name match
+    elif _is_id_prefix(ident_lower):
+        # Looks like a partial UUID: try prefix match (server-side; older servers
+        # ignore id_prefix and return everything, which the startswith filter handles)
+        try:
+            rows = cli_auth.cached_get(f"/api/v1/{resource}?id_prefix={ident_lower}&limit=500")
+        except RuntimeError as e:
+            console.print(f"[red]Error fetching {resource}: {e}[/red]")
+            raise typer.Exit(1) from None
+
+        matches = [row for row in rows if row["id"].startswith(ident_lower)]
+
+        if len(matches) == 1:
+            return matches[0]
+        elif len(matches) > 1:
+            console.print(
+                f"[red]Ambiguous ID '{identifier}' matches {len(matches)} {resource}:[/red]"
+            )
+            for row in matches[:5]:
+                console.print(f"  {row['id'][:8]}  {describe(row)}")
+            raise typer.Exit(1)
+        # Fall through to try name match
+
+    # Try exact name match (server-side)
+    query = urlencode({"name": identifier, "name_exact": "true", "limit": name_limit})
+    response = cli_auth.api_request("GET", f"/api/v1/{resource}?{query}")
+    if response.status_code != 200:
+        console.print(f"[red]Error searching {resource}: {response.text}[/red]")
+        raise typer.Exit(1)
+
+    ident_folded = identifier.casefold()
+    exact_matches = [row for row in response.json() if name_matches(row, ident_folded)]
+
+    if len(exact_matches) == 1:
+        return exact_matches[0]
+    elif len(exact_matches) > 1:
+        console.print(f"[red]Multiple {resource} match '{identifier}':[/red]")
+        for row in exact_matches[:5]:
+            console.print(f"  {row['id'][:8]}  {describe(row)}")
+        raise typer.Exit(1)
+
+    return None
+
+
+def _resolve_concurrently(*lookups: tuple[Callable[[str], dict], str]) -> list[dict]:
+    """Run independent resolvers in parallel, e.g. a swimmer and a team.
+
+    Each resolver is at least one API round trip, so resolving them together
+    costs one round trip of latency instead of one per entity.
+
+    Args:
+        lookups: (resolver, identifier) pairs
+
+    Returns:
+        Resolved dicts, in the order of lookups
+
+    Raises:
+        typer.Exit: If any resolver fails (the first failure in lookup order)
+    """
+    with ThreadPoolExecutor(max_workers=len(lookups)) as pool:
+        futures = [pool.submit(resolve, identifier) for resolve, identifier in lookups]
+        return [future.result() for future in futures]
+
+
 # =============================================================================
 # AUTH COMMANDS
 # =============================================================================
@@ -56,7 +229,7 @@ def auth_login(
     email = username if "@" in username else f"{username}@{DEFAULT_DOMAIN}"
 
     try:
-        with console.status("Logging in..."):
+        with _status("Logging in..."):
             creds = cli_auth.login(email, password)
 
         console.print(f"[green]Logged in as {creds.display_name or creds.email}[/green]")
@@ -105,7 +278,7 @@ def auth_whoami():
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1) from None
 
-    with console.status("Fetching user info..."):
+    with _status("Fetching user info..."):
         user = cli_auth.get_current_user()
 
     if not user:
@@ -132,9 +305,14 @@ def auth_whoami():
 ts_app = typer.Typer(help="Time standards commands", no_args_is_help=True)
 app.add_typer(ts_app, name="ts")
 
+# Shared read-only default for missing nested objects (avoids a new {} per row)
+_EMPTY: dict = {}
+
 
 def _parse_image_to_json(image_path: Path) -> Path:
     """Parse image and save to JSON file. Returns JSON path."""
+    import pydantic_core
+
     from swimcuttimes.parser import TimeStandardParser
 
     # Check for API key
@@ -144,7 +322,7 @@ def _parse_image_to_json(image_path: Path) -> Path:
         raise typer.Exit(1)
 
     console.print(f"[cyan]Parsing image:[/cyan] {image_path}")
-    with console.status("Analyzing image with Claude Vision..."):
+    with _status("Analyzing image with Claude Vision..."):
         try:
             parser = TimeStandardParser()
             sheet = parser.parse_image_file(image_path)
@@ -163,140 +341,137 @@ def _parse_image_to_json(image_path: Path) -> Path:
     console.print(f"  Entries: {len(sheet.entries)}")
 
     # Save to JSON file alongside the image
-    import json
-
     json_path = image_path.with_suffix(".json")
-    json_data = {
-        "title": sheet.title,
-        "sanctioning_body": sheet.sanctioning_body,
-        "standard_name": sheet.standard_name,
-        "effective_year": sheet.effective_year,
-        "age_group": sheet.age_group,
-        "qualifying_period_start": sheet.qualifying_period_start,
-        "qualifying_period_end": sheet.qualifying_period_end,
-        "entries": [
-            {
-                "event_distance": e.event_distance,
-                "event_stroke": e.event_stroke.value,
-                "course": e.course.value,
-                "gender": e.gender.value,
-                "time_str": e.time_str,
-                "cut_level": e.cut_level,
-            }
-            for e in sheet.entries
-        ],
-    }
-    json_path.write_text(json.dumps(json_data, indent=2))
+    # Serialize straight to UTF-8 bytes; no intermediate str
+    json_path.write_bytes(pydantic_core.to_json(sheet, indent=2))
 
     console.print()
     console.print(f"[green]Saved to:[/green] {json_path}")
     return json_path
 
 
-def _load_json_to_db(json_path: Path) -> None:
-    """Load time standards from JSON file into database."""
-    import json
+# Time standards sent per bulk request when importing
+_TS_IMPORT_BATCH_SIZE = 100
+_TS_PREVIEW_ROWS = 15
+# Concurrent single-standard requests when a bulk request has to be retried
+_TS_IMPORT_WORKERS = 8
+
+
+def _ts_payload(ts) -> dict:
+    """Build the API request body for a TimeStandard model."""
+    return {
+        "event": {
+            "stroke": ts.event.stroke.value,
+            "distance": ts.event.distance,
+            "course": ts.event.course.value,
+        },
+        "gender": ts.gender.value,
+        "age_group": ts.age_group,
+        "standard_name": ts.standard_name,
+        "cut_level": ts.cut_level,
+        "sanctioning_body": ts.sanctioning_body,
+        "time_centiseconds": ts.time_centiseconds,
+        "effective_year": ts.effective_year,
+    }
+
+
+def _post_time_standard(ts):
+    """Create a single time standard via the API."""
+    return cli_auth.api_request("POST", "/api/v1/time-standards", json_data=_ts_payload(ts))
+
 
+def _load_json_to_db(
+    json_path: Path, force: bool = False, batch_size: int = _TS_IMPORT_BATCH_SIZE
+) -> None:
+    """Load time standards from JSON file into database.
+
+    Args:
+        json_path: Path to the parsed sheet JSON
+        force: Import without asking for confirmation
+        batch_size: Standards per bulk request
+    """
     from swimcuttimes.parser import convert_sheet_to_time_standards
-    from swimcuttimes.parser.schemas import ParsedTimeEntry, ParsedTimeStandardSheet
-    from swimcuttimes.models import Course, Gender, Stroke
+    from swimcuttimes.parser.schemas import ParsedTimeStandardSheet
 
     # Load JSON
-    data = json.loads(json_path.read_text())
-
-    # Convert back to ParsedTimeStandardSheet
-    entries = [
-        ParsedTimeEntry(
-            event_distance=e["event_distance"],
-            event_stroke=Stroke(e["event_stroke"]),
-            course=Course(e["course"]),
-            gender=Gender(e["gender"]),
-            time_str=e["time_str"],
-            cut_level=e["cut_level"],
-        )
-        for e in data["entries"]
-    ]
+    data = cli_auth.json_loads(json_path.read_bytes())
 
-    sheet = ParsedTimeStandardSheet(
-        title=data.get("title", ""),
-        sanctioning_body=data.get("sanctioning_body", ""),
-        standard_name=data.get("standard_name", ""),
-        effective_year=data.get("effective_year", 2025),
-        age_group=data.get("age_group"),
-        qualifying_period_start=data.get("qualifying_period_start"),
-        qualifying_period_end=data.get("qualifying_period_end"),
-        entries=entries,
+    # Convert back to ParsedTimeStandardSheet. Validating the raw dict lets
+    # pydantic-core coerce every entry's enums in one pass.
+    sheet = ParsedTimeStandardSheet.model_validate(
+        {"title": "", "sanctioning_body": "", "standard_name": "", "effective_year": 2025, **data}
     )
 
     # Convert to time standards
     standards = convert_sheet_to_time_standards(sheet)
 
     # Pivot for preview - group by event/gender to show both cut levels
-    pivoted = _pivot_standards_models(standards)
+    pivoted, total_events = _pivot_standards_models(standards, limit=_TS_PREVIEW_ROWS)
 
     # Preview table
     console.print()
-    preview_table = _make_ts_table(f"Preview ({len(pivoted)} events)", pivoted[:15])
+    preview_table = _make_ts_table(f"Preview ({total_events} events)", pivoted)
     console.print(preview_table)
 
-    if len(pivoted) > 15:
-        console.print(f"[dim]... and {len(pivoted) - 15} more events[/dim]")
+    if total_events > _TS_PREVIEW_ROWS:
+        console.print(f"[dim]... and {total_events - _TS_PREVIEW_ROWS} more events[/dim]")
 
     console.print()
 
     # Confirm import
-    if not typer.confirm(f"Import {len(standards)} time standards?"):
+    if not force and not typer.confirm(f"Import {len(standards)} time standards?"):
         console.print("[yellow]Cancelled[/yellow]")
         raise typer.Exit(0)
 
-    # Import via API
+    # Import via API, one bulk request per batch
     imported = 0
     errors = 0
     error_messages: list[str] = []
 
     with console.status("Importing time standards...") as status:
-        for i, ts in enumerate(standards):
-            status.update(f"Importing time standards... ({i + 1}/{len(standards)})")
+        for start in range(0, len(standards), batch_size):
+            batch = standards[start : start + batch_size]
+            status.update(
+                f"Importing time standards... ({start + len(batch)}/{len(standards)})"
+            )
 
             response = cli_auth.api_request(
                 "POST",
-                "/api/v1/time-standards",
-                json_data={
-                    "event": {
-                        "stroke": ts.event.stroke.value,
-                        "distance": ts.event.distance,
-                        "course": ts.event.course.value,
-                    },
-                    "gender": ts.gender.value,
-                    "age_group": ts.age_group,
-                    "standard_name": ts.standard_name,
-                    "cut_level": ts.cut_level,
-                    "sanctioning_body": ts.sanctioning_body,
-                    "time_centiseconds": ts.time_centiseconds,
-                    "effective_year": ts.effective_year,
-                },
+                "/api/v1/time-standards/bulk",
+                json_data={"standards": [_ts_payload(ts) for ts in batch]},
             )
-
             if response.status_code in (200, 201):
-                imported += 1
-            else:
-                errors += 1
-                if len(error_messages) < 5:
-                    event_str = f"{ts.event.distance} {ts.event.stroke.value} {ts.event.course.value.upper()}"
-                    try:
-                        detail = response.json().get("detail", response.text)
-                    except Exception:
-                        detail = response.text
-                    error_messages.append(f"{event_str}: {response.status_code} - {detail}")
+                imported += len(batch)
+                continue
+
+            # The bulk insert is all-or-nothing (and older servers lack it), so
+            # retry this batch one at a time to import what we can and report
+            # per-standard errors. Requests are independent, so run a few at once.
+            with ThreadPoolExecutor(max_workers=_TS_IMPORT_WORKERS) as pool:
+                responses = list(pool.map(_post_time_standard, batch))
+
+            for ts, response in zip(batch, responses, strict=True):
+                if response.status_code in (200, 201):
+                    imported += 1
+                else:
+                    errors += 1
+                    if len(error_messages) < 5:
+                        event = ts.event
+                        event_str = (
+                            f"{event.distance} {event.stroke.value} {event.course.value.upper()}"
+                        )
+                        error_messages.append(
+                            f"{event_str}: {response.status_code} - {_error_detail(response)}"
+                        )
 
     console.print()
     console.print(f"[green]Imported {imported} time standards[/green]")
     if errors:
-        console.print(f"[red]Errors: {errors}[/red]")
-        for msg in error_messages:
-            console.print(f"  [dim]{msg}[/dim]")
+        lines = [f"[red]Errors: {errors}[/red]"]
+        lines.extend(f"  [dim]{msg}[/dim]" for msg in error_messages)
         if errors > len(error_messages):
-            console.print(f"  [dim]... and {errors - len(error_messages)} more[/dim]")
+            lines.append(f"  [dim]... and {errors - len(error_messages)} more[/dim]")
+        console.print("\n".join(lines))
 
 
 @ts_app.command("parse")
@@ -316,6 +491,10 @@ def ts_parse(
 @ts_app.command("load")
 def ts_load(
     json_path: Path = typer.Argument(..., help="Path to time standards JSON file"),
+    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
+    batch_size: int = typer.Option(
+        _TS_IMPORT_BATCH_SIZE, "--batch-size", min=1, max=500, help="Standards per request"
+    ),
 ):
     """Load time standards from a JSON file into the database."""
     if not json_path.exists():
@@ -329,12 +508,16 @@ def ts_load(
         raise typer.Exit(1) from None
 
     console.print(f"[cyan]Loading:[/cyan] {json_path}")
-    _load_json_to_db(json_path)
+    _load_json_to_db(json_path, force=force, batch_size=batch_size)
 
 
 @ts_app.command("import")
 def ts_import(
     image_path: Path = typer.Argument(..., help="Path to time standards image"),
+    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
+    batch_size: int = typer.Option(
+        _TS_IMPORT_BATCH_SIZE, "--batch-size", min=1, max=500, help="Standards per request"
+    ),
 ):
     """Parse image and import to database in one step."""
     if not image_path.exists():
@@ -351,13 +534,19 @@ def ts_import(
     json_path = _parse_image_to_json(image_path)
 
     # Step 2: Load to database
-    _load_json_to_db(json_path)
+    _load_json_to_db(json_path, force=force, batch_size=batch_size)
 
 
-def _pivot_standards_models(standards: list) -> list[dict]:
-    """Pivot TimeStandard models to group Cut Off Time and Cut Time into single rows."""
-    from collections import defaultdict
+def _pivot_standards_models(standards: list, limit: int | None = None) -> tuple[list[dict], int]:
+    """Pivot TimeStandard models to group Cut Off Time and Cut Time into single rows.
 
+    Args:
+        standards: List of TimeStandard models
+        limit: Only build rows for the first N groups; later groups are counted
+
+    Returns:
+        Tuple of (pivoted rows, total number of groups)
+    """
     grouped: dict[tuple, dict] = defaultdict(lambda: {
         "event": None,
         "gender": None,
@@ -366,6 +555,9 @@ def _pivot_standards_models(standards: list) -> list[dict]:
         "cut_time": "-",
     })
 
+    overflow: set[tuple] = set()
+    formatted: dict[int, str] = {}
+
     for ts in standards:
         key = (
             ts.event.distance,
@@ -375,20 +567,32 @@ def _pivot_standards_models(standards: list) -> list[dict]:
             ts.age_group,
         )
 
+        if limit is not None and key not in grouped and len(grouped) >= limit:
+            overflow.add(key)
+            continue
+
         row = grouped[key]
-        row["event"] = ts.event
-        row["gender"] = ts.gender.value
-        row["age_group"] = ts.age_group
+        if row["event"] is None:
+            # Same shape as API event dicts so _make_ts_table has one code path
+            row["event"] = {"distance": key[0], "stroke": key[1], "course": key[2]}
+            row["gender"] = key[3]
+            row["age_group"] = key[4]
 
         cut_level = (ts.cut_level or "").lower()
-        time_str = ts.time_formatted
-
         if "cut off" in cut_level:
-            row["cut_off_time"] = time_str
+            column = "cut_off_time"
         elif "cut" in cut_level:
-            row["cut_time"] = time_str
+            column = "cut_time"
+        else:
+            continue
 
-    return list(grouped.values())
+        # Sheets repeat times across genders/age groups; format each value once
+        time_str = formatted.get(ts.time_centiseconds)
+        if time_str is None:
+            time_str = formatted[ts.time_centiseconds] = ts.time_formatted
+        row[column] = time_str
+
+    return list(grouped.values()), len(grouped) + len(overflow)
 
 
 def _pivot_time_standards(standards: list[dict]) -> list[dict]:
@@ -400,8 +604,6 @@ def _pivot_time_standards(standards: list[dict]) -> list[dict]:
     Returns:
         List of pivoted rows with cut_off_time and cut_time columns
     """
-    from collections import defaultdict
-
     # Group by event + gender + age_group
     grouped: dict[tuple, dict] = defaultdict(lambda: {
         "event": None,
@@ -412,7 +614,7 @@ def _pivot_time_standards(standards: list[dict]) -> list[dict]:
     })
 
     for ts in standards:
-        event = ts.get("event", {})
+        event = ts.get("event") or _EMPTY
         key = (
             event.get("distance"),
             event.get("stroke"),
@@ -422,11 +624,12 @@ def _pivot_time_standards(standards: list[dict]) -> list[dict]:
         )
 
         row = grouped[key]
-        row["event"] = event
-        row["gender"] = ts.get("gender")
-        row["age_group"] = ts.get("age_group")
+        if row["event"] is None:
+            row["event"] = event
+            row["gender"] = key[3]
+            row["age_group"] = key[4]
 
-        cut_level = ts.get("cut_level", "").lower()
+        cut_level = (ts.get("cut_level") or "").lower()
         time_str = ts.get("time_formatted", "-")
 
         if "cut off" in cut_level:
@@ -447,34 +650,21 @@ def _make_ts_table(title: str, rows: list[dict]) -> Table:
     table.add_column("Cut Off Time", style="yellow")
     table.add_column("Cut Time", style="green")
 
+    cells = []
     for row in rows:
-        event = row.get("event", {})
-        if isinstance(event, dict):
-            dist = event.get("distance", "?")
-            stroke = event.get("stroke", "?")
-            course = event.get("course", "?").upper()
-        else:
-            # Handle model objects
-            dist = getattr(event, "distance", "?")
-            stroke = getattr(event, "stroke", "?")
-            if hasattr(stroke, "value"):
-                stroke = stroke.value
-            course = getattr(event, "course", "?")
-            if hasattr(course, "value"):
-                course = course.value.upper()
-            else:
-                course = str(course).upper()
-
-        event_str = f"{dist} {stroke}"
-
-        table.add_row(
-            event_str,
-            course,
+        event = row.get("event") or _EMPTY
+        get = event.get
+        cells.append((
+            f"{get('distance', '?')} {get('stroke', '?')}",
+            get("course", "?").upper(),
             str(row.get("gender", "-")).upper(),
             row.get("age_group") or "Open",
             row.get("cut_off_time", "-"),
             row.get("cut_time", "-"),
-        )
+        ))
+
+    for row_cells in cells:
+        table.add_row(*row_cells)
 
     return table
 
@@ -495,24 +685,19 @@ def ts_list(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1) from None
 
-    # Build query params
-    params = []
-    if gender:
-        params.append(f"gender={gender.upper()}")
-    if stroke:
-        params.append(f"stroke={stroke.lower()}")
-    if course:
-        params.append(f"course={course.lower()}")
-    if distance:
-        params.append(f"distance={distance}")
-    if age_group:
-        params.append(f"age_group={age_group}")
-    params.append(f"limit={limit}")
-
-    query = "&".join(params)
-    path = f"/api/v1/time-standards?{query}"
+    # Build query params (urlencode escapes spaces, "&", etc. in values)
+    filters = {
+        "gender": gender and gender.upper(),
+        "stroke": stroke and stroke.lower(),
+        "course": course and course.lower(),
+        "distance": distance,
+        "age_group": age_group,
+    }
+    params = {key: value for key, value in filters.items() if value}
+    params["limit"] = limit
+    path = f"/api/v1/time-standards?{urlencode(params)}"
 
-    with console.status("Fetching time standards..."):
+    with _status("Fetching time standards..."):
         response = cli_auth.api_request("GET", path)
 
     if response.status_code != 200:
@@ -547,6 +732,16 @@ def ts_list(
 invite_app = typer.Typer(help="Invitation management (admin only)", no_args_is_help=True)
 app.add_typer(invite_app, name="invite")
 
+# User roles, highest privilege first
+_ROLES = ("admin", "coach", "swimmer", "fan")
+
+_INVITE_STATUS_COLORS = {
+    "pending": "yellow",
+    "accepted": "green",
+    "expired": "dim",
+    "revoked": "red",
+}
+
 
 @invite_app.command("create")
 def invite_create(
@@ -561,12 +756,11 @@ def invite_create(
         raise typer.Exit(1) from None
 
     # Validate role
-    valid_roles = ["admin", "coach", "swimmer", "fan"]
-    if role.lower() not in valid_roles:
-        console.print(f"[red]Invalid role. Must be one of: {', '.join(valid_roles)}[/red]")
+    if role.lower() not in _ROLES:
+        console.print(f"[red]Invalid role. Must be one of: {', '.join(_ROLES)}[/red]")
         raise typer.Exit(1)
 
-    with console.status(f"Creating invitation for {email}..."):
+    with _status(f"Creating invitation for {email}..."):
         response = cli_auth.api_request(
             "POST",
             "/api/v1/auth/invitations",
@@ -608,22 +802,24 @@ def _resolve_invitation(identifier: str) -> dict:
     Raises:
         typer.Exit: If invitation not found or ambiguous
     """
-    import re
+    ident_lower = identifier.lower()
+
+    # Check if it looks like a UUID (hex chars, possibly with dashes)
+    is_id_prefix = _is_id_prefix(ident_lower)
 
-    # Fetch all invitations
-    response = cli_auth.api_request("GET", "/api/v1/auth/invitations")
+    # Fetch only candidate invitations (older servers ignore the filter and
+    # return all of them; the matching below works either way)
+    query = f"id_prefix={ident_lower}" if is_id_prefix else f"email={quote(identifier)}"
+    response = cli_auth.api_request("GET", f"/api/v1/auth/invitations?{query}")
     if response.status_code != 200:
         console.print(f"[red]Error fetching invitations: {response.text}[/red]")
         raise typer.Exit(1)
 
     invites = response.json()
 
-    # Check if it looks like a UUID (hex chars, possibly with dashes)
-    is_uuid_like = bool(re.match(r'^[0-9a-f-]+$', identifier.lower()))
-
-    if is_uuid_like and len(identifier.replace('-', '')) >= 8:
+    if is_id_prefix:
         # Try partial UUID match
-        matches = [i for i in invites if i["id"].startswith(identifier.lower())]
+        matches = [i for i in invites if i["id"].startswith(ident_lower)]
 
         if len(matches) == 1:
             return matches[0]
@@ -634,7 +830,7 @@ def _resolve_invitation(identifier: str) -> dict:
             raise typer.Exit(1)
 
     # Try email match
-    email_matches = [i for i in invites if i["email"].lower() == identifier.lower()]
+    email_matches = [i for i in invites if i["email"].lower() == ident_lower]
 
     if len(email_matches) == 1:
         return email_matches[0]
@@ -663,7 +859,7 @@ def invite_list():
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1) from None
 
-    with console.status("Fetching invitations..."):
+    with _status("Fetching invitations..."):
         response = cli_auth.api_request("GET", "/api/v1/auth/invitations")
 
     if response.status_code != 200:
@@ -683,18 +879,11 @@ def invite_list():
     table.add_column("Status", no_wrap=True)
 
     for inv in invites:
-        status_color = {
-            "pending": "yellow",
-            "accepted": "green",
-            "expired": "dim",
-            "revoked": "red",
-        }.get(inv["status"], "white")
-
         table.add_row(
             inv["id"][:8],
             inv["email"],
             inv["role"],
-            f"[{status_color}]{inv['status']}[/{status_color}]",
+            Text(inv["status"], style=_INVITE_STATUS_COLORS.get(inv["status"], "white")),
         )
 
     console.print(table)
@@ -712,14 +901,14 @@ def invite_revoke(
         raise typer.Exit(1) from None
 
     # Resolve invitation first
-    with console.status("Finding invitation..."):
+    with _status("Finding invitation..."):
         invite = _resolve_invitation(invite_ref)
 
     if invite["status"] != "pending":
         console.print(f"[red]Cannot revoke invitation with status '{invite['status']}'[/red]")
         raise typer.Exit(1)
 
-    with console.status("Revoking invitation..."):
+    with _status("Revoking invitation..."):
         response = cli_auth.api_request("DELETE", f"/api/v1/auth/invitations/{invite['id']}")
 
     if response.status_code == 404:
@@ -740,6 +929,14 @@ def invite_revoke(
 teams_app = typer.Typer(help="Team management", no_args_is_help=True)
 app.add_typer(teams_app, name="teams")
 
+_TEAM_TYPE_COLORS = {
+    "club": "blue",
+    "high_school": "green",
+    "college": "magenta",
+    "national": "yellow",
+    "olympic": "red",
+}
+
 
 def _resolve_team(identifier: str) -> dict:
     """Resolve a team by ID (partial UUID) or name.
@@ -753,50 +950,48 @@ def _resolve_team(identifier: str) -> dict:
     Raises:
         typer.Exit: If team not found or ambiguous
     """
-    import re
-
-    # Check if it looks like a UUID (hex chars, possibly with dashes)
-    is_uuid_like = bool(re.match(r'^[0-9a-f-]+$', identifier.lower()))
-
-    if is_uuid_like and len(identifier.replace('-', '')) >= 8:
-        # Try partial UUID match - fetch all teams and filter
-        response = cli_auth.api_request("GET", "/api/v1/teams?limit=500")
-        if response.status_code != 200:
-            console.print(f"[red]Error fetching teams: {response.text}[/red]")
-            raise typer.Exit(1)
-
-        teams = response.json()
-        matches = [t for t in teams if t["id"].startswith(identifier.lower())]
+    team = _resolve_entity(
+        identifier,
+        resource="teams",
+        name_limit=10,
+        name_matches=lambda t, name: t["name"].casefold() == name,
+        describe=lambda t: t["name"],
+    )
+    if team is not None:
+        return team
 
-        if len(matches) == 1:
-            return matches[0]
-        elif len(matches) > 1:
-            console.print(f"[red]Ambiguous ID '{identifier}' matches {len(matches)} teams:[/red]")
-            for t in matches[:5]:
-                console.print(f"  {t['id'][:8]}  {t['name']}")
-            raise typer.Exit(1)
-        # Fall through to try name match
+    console.print(f"[red]Team not found: '{identifier}'[/red]")
+    console.print("[dim]Use a partial UUID (min 8 chars) or exact team name[/dim]")
+    raise typer.Exit(1)
 
-    # Try exact name match
-    response = cli_auth.api_request("GET", f"/api/v1/teams?name={identifier}&limit=10")
-    if response.status_code != 200:
-        console.print(f"[red]Error searching teams: {response.text}[/red]")
-        raise typer.Exit(1)
 
-    teams = response.json()
-    # Look for exact name match (API does partial match)
-    exact_matches = [t for t in teams if t["name"].lower() == identifier.lower()]
+def _make_teams_table(title: str, teams: list[dict]) -> Table:
+    """Create a teams table with type-colored rows."""
+    table = Table(title=title)
+    table.add_column("ID", style="dim", no_wrap=True)
+    table.add_column("Name", style="cyan", no_wrap=True)
+    table.add_column("Type", no_wrap=True)
+    table.add_column("Body", no_wrap=True)
+    table.add_column("LSC", no_wrap=True)
 
-    if len(exact_matches) == 1:
-        return exact_matches[0]
-    elif len(exact_matches) > 1:
-        console.print(f"[red]Multiple teams match '{identifier}'[/red]")
-        raise typer.Exit(1)
+    rows = [
+        (
+            team["id"][:8],
+            team["name"],
+            Text(
+                team.get("team_type", ""),
+                style=_TEAM_TYPE_COLORS.get(team.get("team_type"), "white"),
+            ),
+            team.get("sanctioning_body", "-"),
+            # Show relevant field based on team type
+            team.get("lsc") or team.get("division") or team.get("state") or "-",
+        )
+        for team in teams
+    ]
+    for row in rows:
+        table.add_row(*row)
 
-    # No match found
-    console.print(f"[red]Team not found: '{identifier}'[/red]")
-    console.print("[dim]Use a partial UUID (min 8 chars) or exact team name[/dim]")
-    raise typer.Exit(1)
+    return table
 
 
 @teams_app.command("list")
@@ -816,22 +1011,13 @@ def teams_list(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1) from None
 
-    # Build query params
-    params = []
-    if name:
-        params.append(f"name={name}")
-    if team_type:
-        params.append(f"team_type={team_type}")
-    if lsc:
-        params.append(f"lsc={lsc}")
-    if state:
-        params.append(f"state={state}")
-    params.append(f"limit={limit}")
-
-    query = "&".join(params)
-    path = f"/api/v1/teams?{query}"
+    # Build query params (urlencode escapes spaces, "&", etc. in names)
+    filters = {"name": name, "team_type": team_type, "lsc": lsc, "state": state}
+    params = {key: value for key, value in filters.items() if value}
+    params["limit"] = limit
+    path = f"/api/v1/teams?{urlencode(params)}"
 
-    with console.status("Fetching teams..."):
+    with _status("Fetching teams..."):
         response = cli_auth.api_request("GET", path)
 
     if response.status_code != 200:
@@ -844,35 +1030,7 @@ def teams_list(
         console.print("[yellow]No teams found[/yellow]")
         return
 
-    table = Table(title=f"Teams ({len(teams)})")
-    table.add_column("ID", style="dim", no_wrap=True)
-    table.add_column("Name", style="cyan", no_wrap=True)
-    table.add_column("Type", no_wrap=True)
-    table.add_column("Body", no_wrap=True)
-    table.add_column("LSC", no_wrap=True)
-
-    for team in teams:
-        team_type_val = team.get("team_type", "")
-        type_color = {
-            "club": "blue",
-            "high_school": "green",
-            "college": "magenta",
-            "national": "yellow",
-            "olympic": "red",
-        }.get(team_type_val, "white")
-
-        # Show relevant field based on team type
-        extra = team.get("lsc") or team.get("division") or team.get("state") or "-"
-
-        table.add_row(
-            team["id"][:8],
-            team["name"],
-            f"[{type_color}]{team_type_val}[/{type_color}]",
-            team.get("sanctioning_body", "-"),
-            extra,
-        )
-
-    console.print(table)
+    console.print(_make_teams_table(f"Teams ({len(teams)})", teams))
 
 
 @teams_app.command("get")
@@ -886,7 +1044,7 @@ def teams_get(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1) from None
 
-    with console.status("Fetching team..."):
+    with _status("Fetching team..."):
         team = _resolve_team(team_ref)
 
     table = Table(title="Team Details")
@@ -931,35 +1089,20 @@ def teams_create(
         "team_type": team_type,
         "sanctioning_body": sanctioning_body,
     }
-    if lsc:
-        payload["lsc"] = lsc
-    if division:
-        payload["division"] = division
-    if state:
-        payload["state"] = state
-    if country:
-        payload["country"] = country
+    payload.update(
+        (k, v)
+        for k, v in (("lsc", lsc), ("division", division), ("state", state), ("country", country))
+        if v
+    )
 
-    with console.status("Creating team..."):
+    with _status("Creating team..."):
         response = cli_auth.api_request("POST", "/api/v1/teams", json_data=payload)
 
-    if response.status_code == 400:
-        err = response.json()
-        console.print(f"[red]Validation error: {err.get('detail', response.text)}[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 403:
-        console.print("[red]Admin access required[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 409:
-        err = response.json()
-        console.print(f"[red]{err.get('detail', 'Team name already exists')}[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code != 201:
-        console.print(f"[red]Error: {response.text}[/red]")
-        raise typer.Exit(1)
+    _check_status(
+        response,
+        201,
+        {400: "Validation error: {detail}", 403: "Admin access required", 409: "{detail}"},
+    )
 
     team = response.json()
     console.print("[green]Team created![/green]")
@@ -987,52 +1130,40 @@ def teams_update(
         raise typer.Exit(1) from None
 
     # Resolve team first
-    with console.status("Finding team..."):
+    with _status("Finding team..."):
         team = _resolve_team(team_ref)
     team_id = team["id"]
 
-    payload = {}
-    if name:
-        payload["name"] = name
-    if sanctioning_body:
-        payload["sanctioning_body"] = sanctioning_body
-    if lsc:
-        payload["lsc"] = lsc
-    if division:
-        payload["division"] = division
-    if state:
-        payload["state"] = state
-    if country:
-        payload["country"] = country
+    payload = {
+        k: v
+        for k, v in (
+            ("name", name),
+            ("sanctioning_body", sanctioning_body),
+            ("lsc", lsc),
+            ("division", division),
+            ("state", state),
+            ("country", country),
+        )
+        if v
+    }
 
     if not payload:
         console.print("[yellow]No updates provided[/yellow]")
         raise typer.Exit(1)
 
-    with console.status("Updating team..."):
+    with _status("Updating team..."):
         response = cli_auth.api_request("PATCH", f"/api/v1/teams/{team_id}", json_data=payload)
 
-    if response.status_code == 404:
-        console.print("[red]Team not found[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 400:
-        err = response.json()
-        console.print(f"[red]Validation error: {err.get('detail', response.text)}[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 403:
-        console.print("[red]Admin access required[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 409:
-        err = response.json()
-        console.print(f"[red]{err.get('detail', 'Team name already exists')}[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code != 200:
-        console.print(f"[red]Error: {response.text}[/red]")
-        raise typer.Exit(1)
+    _check_status(
+        response,
+        200,
+        {
+            400: "Validation error: {detail}",
+            403: "Admin access required",
+            404: "Team not found",
+            409: "{detail}",
+        },
+    )
 
     team = response.json()
     console.print("[green]Team updated![/green]")
@@ -1052,7 +1183,7 @@ def teams_delete(
         raise typer.Exit(1) from None
 
     # Resolve team first
-    with console.status("Finding team..."):
+    with _status("Finding team..."):
         team = _resolve_team(team_ref)
     team_id = team["id"]
 
@@ -1060,16 +1191,10 @@ def teams_delete(
         console.print("[yellow]Cancelled[/yellow]")
         raise typer.Exit(0)
 
-    with console.status("Deleting team..."):
+    with _status("Deleting team..."):
         response = cli_auth.api_request("DELETE", f"/api/v1/teams/{team_id}")
 
-    if response.status_code == 403:
-        console.print("[red]Admin access required[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code != 204:
-        console.print(f"[red]Error: {response.text}[/red]")
-        raise typer.Exit(1)
+    _check_status(response, 204, {403: "Admin access required"})
 
     console.print(f"[green]Team '{team['name']}' deleted[/green]")
 
@@ -1082,6 +1207,15 @@ swimmers_app = typer.Typer(help="Swimmer management", no_args_is_help=True)
 app.add_typer(swimmers_app, name="swimmers")
 
 
+def _swimmer_name_matches(swimmer: dict, name: str) -> bool:
+    """Check a casefolded name against "First Last", "Last, First" or the last name."""
+    last = swimmer["last_name"].casefold()
+    if name == last:
+        return True
+    first = swimmer["first_name"].casefold()
+    return name == f"{first} {last}" or name == f"{last}, {first}"
+
+
 def _resolve_swimmer(identifier: str) -> dict:
     """Resolve a swimmer by ID (partial UUID), name, or USA Swimming ID.
 
@@ -1094,60 +1228,21 @@ def _resolve_swimmer(identifier: str) -> dict:
     Raises:
         typer.Exit: If swimmer not found or ambiguous
     """
-    import re
-
-    # Check if it looks like a UUID (hex chars, possibly with dashes)
-    is_uuid_like = bool(re.match(r'^[0-9a-f-]+$', identifier.lower()))
-
-    if is_uuid_like and len(identifier.replace('-', '')) >= 8:
-        # Try partial UUID match - fetch all swimmers and filter
-        response = cli_auth.api_request("GET", "/api/v1/swimmers?limit=500")
-        if response.status_code != 200:
-            console.print(f"[red]Error fetching swimmers: {response.text}[/red]")
-            raise typer.Exit(1)
-
-        swimmers = response.json()
-        matches = [s for s in swimmers if s["id"].startswith(identifier.lower())]
-
-        if len(matches) == 1:
-            return matches[0]
-        elif len(matches) > 1:
-            console.print(f"[red]Ambiguous ID '{identifier}' matches {len(matches)} swimmers:[/red]")
-            for s in matches[:5]:
-                console.print(f"  {s['id'][:8]}  {s['first_name']} {s['last_name']}")
-            raise typer.Exit(1)
-        # Fall through to try name match
-
-    # Try name match (search API does partial match)
-    response = cli_auth.api_request("GET", f"/api/v1/swimmers?name={identifier}&limit=10")
-    if response.status_code != 200:
-        console.print(f"[red]Error searching swimmers: {response.text}[/red]")
-        raise typer.Exit(1)
-
-    swimmers = response.json()
-
-    # Look for exact name match (first last or last, first)
-    name_lower = identifier.lower()
-    exact_matches = []
-    for s in swimmers:
-        full_name = f"{s['first_name']} {s['last_name']}".lower()
-        reverse_name = f"{s['last_name']}, {s['first_name']}".lower()
-        last_name = s['last_name'].lower()
-        if full_name == name_lower or reverse_name == name_lower or last_name == name_lower:
-            exact_matches.append(s)
-
-    if len(exact_matches) == 1:
-        return exact_matches[0]
-    elif len(exact_matches) > 1:
-        console.print(f"[red]Multiple swimmers match '{identifier}':[/red]")
-        for s in exact_matches[:5]:
-            console.print(f"  {s['id'][:8]}  {s['first_name']} {s['last_name']}")
-        raise typer.Exit(1)
+    swimmer = _resolve_entity(
+        identifier,
+        resource="swimmers",
+        name_limit=10,
+        name_matches=_swimmer_name_matches,
+        describe=lambda s: f"{s['first_name']} {s['last_name']}",
+    )
+    if swimmer is not None:
+        return swimmer
 
     # Try USA Swimming ID match
-    response = cli_auth.api_request("GET", "/api/v1/swimmers?limit=500")
-    if response.status_code == 200:
-        swimmers = response.json()
+    with contextlib.suppress(RuntimeError):
+        swimmers = cli_auth.cached_get(
+            f"/api/v1/swimmers?usa_swimming_id={quote(identifier)}&limit=500"
+        )
         usa_matches = [s for s in swimmers if s.get("usa_swimming_id") == identifier]
         if len(usa_matches) == 1:
             return usa_matches[0]
@@ -1158,6 +1253,34 @@ def _resolve_swimmer(identifier: str) -> dict:
     raise typer.Exit(1)
 
 
+def _make_swimmers_table(title: str, swimmers: list[dict]) -> Table:
+    """Create a swimmers table with gender-colored rows."""
+    table = Table(title=title)
+    table.add_column("ID", style="dim", no_wrap=True)
+    table.add_column("Name", style="cyan", no_wrap=True)
+    table.add_column("Gender", no_wrap=True)
+    table.add_column("Age", no_wrap=True)
+    table.add_column("Age Group", no_wrap=True)
+
+    rows = [
+        (
+            swimmer["id"][:8],
+            f"{swimmer['first_name']} {swimmer['last_name']}",
+            Text(
+                swimmer.get("gender", "-"),
+                style="blue" if swimmer.get("gender") == "M" else "magenta",
+            ),
+            str(swimmer.get("age", "-")),
+            swimmer.get("age_group", "-"),
+        )
+        for swimmer in swimmers
+    ]
+    for row in rows:
+        table.add_row(*row)
+
+    return table
+
+
 @swimmers_app.command("list")
 def swimmers_list(
     name: str = typer.Option(None, "--name", "-n", help="Filter by name"),
@@ -1174,22 +1297,18 @@ def swimmers_list(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1) from None
 
-    # Build query params
-    params = []
-    if name:
-        params.append(f"name={name}")
-    if gender:
-        params.append(f"gender={gender.upper()}")
-    if min_age:
-        params.append(f"min_age={min_age}")
-    if max_age:
-        params.append(f"max_age={max_age}")
-    params.append(f"limit={limit}")
-
-    query = "&".join(params)
-    path = f"/api/v1/swimmers?{query}"
-
-    with console.status("Fetching swimmers..."):
+    # Build query params (urlencode escapes spaces, "&", etc. in names)
+    filters = {
+        "name": name,
+        "gender": gender.upper() if gender else None,
+        "min_age": min_age,
+        "max_age": max_age,
+    }
+    params = {key: value for key, value in filters.items() if value}
+    params["limit"] = limit
+    path = f"/api/v1/swimmers?{urlencode(params)}"
+
+    with _status("Fetching swimmers..."):
         response = cli_auth.api_request("GET", path)
 
     if response.status_code != 200:
@@ -1202,24 +1321,7 @@ def swimmers_list(
         console.print("[yellow]No swimmers found[/yellow]")
         return
 
-    table = Table(title=f"Swimmers ({len(swimmers)})")
-    table.add_column("ID", style="dim", no_wrap=True)
-    table.add_column("Name", style="cyan", no_wrap=True)
-    table.add_column("Gender", no_wrap=True)
-    table.add_column("Age", no_wrap=True)
-    table.add_column("Age Group", no_wrap=True)
-
-    for swimmer in swimmers:
-        gender_color = "blue" if swimmer.get("gender") == "M" else "magenta"
-        table.add_row(
-            swimmer["id"][:8],
-            f"{swimmer['first_name']} {swimmer['last_name']}",
-            f"[{gender_color}]{swimmer.get('gender', '-')}[/{gender_color}]",
-            str(swimmer.get("age", "-")),
-            swimmer.get("age_group", "-"),
-        )
-
-    console.print(table)
+    console.print(_make_swimmers_table(f"Swimmers ({len(swimmers)})", swimmers))
 
 
 @swimmers_app.command("get")
@@ -1233,7 +1335,7 @@ def swimmers_get(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1) from None
 
-    with console.status("Fetching swimmer..."):
+    with _status("Fetching swimmer..."):
         swimmer = _resolve_swimmer(swimmer_ref)
 
     table = Table(title="Swimmer Details")
@@ -1274,31 +1376,24 @@ def swimmers_create(
         "date_of_birth": birth_date,
         "gender": gender.upper(),
     }
-    if usa_swimming_id:
-        payload["usa_swimming_id"] = usa_swimming_id
-    if swimcloud_url:
-        payload["swimcloud_url"] = swimcloud_url
+    payload.update(
+        (k, v)
+        for k, v in (("usa_swimming_id", usa_swimming_id), ("swimcloud_url", swimcloud_url))
+        if v
+    )
 
-    with console.status("Creating swimmer..."):
+    with _status("Creating swimmer..."):
         response = cli_auth.api_request("POST", "/api/v1/swimmers", json_data=payload)
 
-    if response.status_code == 400:
-        err = response.json()
-        console.print(f"[red]Validation error: {err.get('detail', response.text)}[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 403:
-        console.print("[red]Admin or coach access required[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 409:
-        err = response.json()
-        console.print(f"[red]{err.get('detail', 'Swimmer already exists')}[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code != 201:
-        console.print(f"[red]Error: {response.text}[/red]")
-        raise typer.Exit(1)
+    _check_status(
+        response,
+        201,
+        {
+            400: "Validation error: {detail}",
+            403: "Admin or coach access required",
+            409: "{detail}",
+        },
+    )
 
     swimmer = response.json()
     console.print("[green]Swimmer created![/green]")
@@ -1324,52 +1419,40 @@ def swimmers_update(
         raise typer.Exit(1) from None
 
     # Resolve swimmer first
-    with console.status("Finding swimmer..."):
+    with _status("Finding swimmer..."):
         swimmer = _resolve_swimmer(swimmer_ref)
     swimmer_id = swimmer["id"]
 
-    payload = {}
-    if first_name:
-        payload["first_name"] = first_name
-    if last_name:
-        payload["last_name"] = last_name
-    if birth_date:
-        payload["date_of_birth"] = birth_date
-    if gender:
-        payload["gender"] = gender.upper()
-    if usa_swimming_id:
-        payload["usa_swimming_id"] = usa_swimming_id
-    if swimcloud_url:
-        payload["swimcloud_url"] = swimcloud_url
+    payload = {
+        k: v
+        for k, v in (
+            ("first_name", first_name),
+            ("last_name", last_name),
+            ("date_of_birth", birth_date),
+            ("gender", gender and gender.upper()),
+            ("usa_swimming_id", usa_swimming_id),
+            ("swimcloud_url", swimcloud_url),
+        )
+        if v
+    }
 
     if not payload:
         console.print("[yellow]No updates provided[/yellow]")
         raise typer.Exit(1)
 
-    with console.status("Updating swimmer..."):
+    with _status("Updating swimmer..."):
         response = cli_auth.api_request("PATCH", f"/api/v1/swimmers/{swimmer_id}", json_data=payload)
 
-    if response.status_code == 404:
-        console.print("[red]Swimmer not found[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 400:
-        err = response.json()
-        console.print(f"[red]Validation error: {err.get('detail', response.text)}[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 403:
-        console.print("[red]Admin or coach access required[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 409:
-        err = response.json()
-        console.print(f"[red]{err.get('detail', 'USA Swimming ID already exists')}[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code != 200:
-        console.print(f"[red]Error: {response.text}[/red]")
-        raise typer.Exit(1)
+    _check_status(
+        response,
+        200,
+        {
+            400: "Validation error: {detail}",
+            403: "Admin or coach access required",
+            404: "Swimmer not found",
+            409: "{detail}",
+        },
+    )
 
     swimmer = response.json()
     console.print("[green]Swimmer updated![/green]")
@@ -1389,7 +1472,7 @@ def swimmers_delete(
         raise typer.Exit(1) from None
 
     # Resolve swimmer first
-    with console.status("Finding swimmer..."):
+    with _status("Finding swimmer..."):
         swimmer = _resolve_swimmer(swimmer_ref)
     swimmer_id = swimmer["id"]
     swimmer_name = f"{swimmer['first_name']} {swimmer['last_name']}"
@@ -1398,16 +1481,10 @@ def swimmers_delete(
         console.print("[yellow]Cancelled[/yellow]")
         raise typer.Exit(0)
 
-    with console.status("Deleting swimmer..."):
+    with _status("Deleting swimmer..."):
         response = cli_auth.api_request("DELETE", f"/api/v1/swimmers/{swimmer_id}")
 
-    if response.status_code == 403:
-        console.print("[red]Admin access required[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code != 204:
-        console.print(f"[red]Error: {response.text}[/red]")
-        raise typer.Exit(1)
+    _check_status(response, 204, {403: "Admin access required"})
 
     console.print(f"[green]Swimmer '{swimmer_name}' deleted[/green]")
 
@@ -1425,7 +1502,7 @@ def swimmers_teams(
         raise typer.Exit(1) from None
 
     # Resolve swimmer first
-    with console.status("Finding swimmer..."):
+    with _status("Finding swimmer..."):
         swimmer = _resolve_swimmer(swimmer_ref)
     swimmer_id = swimmer["id"]
     swimmer_name = f"{swimmer['first_name']} {swimmer['last_name']}"
@@ -1433,7 +1510,7 @@ def swimmers_teams(
     current_only = "false" if all_history else "true"
     path = f"/api/v1/swimmers/{swimmer_id}/teams?current_only={current_only}"
 
-    with console.status("Fetching teams..."):
+    with _status("Fetching teams..."):
         response = cli_auth.api_request("GET", path)
 
     if response.status_code != 200:
@@ -1453,7 +1530,10 @@ def swimmers_teams(
     table.add_column("Status", no_wrap=True)
 
     for team in teams:
-        status = "[green]Current[/green]" if team.get("is_current") else "[dim]Past[/dim]"
+        if team.get("is_current"):
+            status = Text("Current", style="green")
+        else:
+            status = Text("Past", style="dim")
         table.add_row(
             team.get("team_name", "-"),
             team.get("start_date", "-"),
@@ -1478,9 +1558,10 @@ def swimmers_assign(
         raise typer.Exit(1) from None
 
     # Resolve swimmer and team
-    with console.status("Finding swimmer and team..."):
-        swimmer = _resolve_swimmer(swimmer_ref)
-        team = _resolve_team(team_ref)
+    with _status("Finding swimmer and team..."):
+        swimmer, team = _resolve_concurrently(
+            (_resolve_swimmer, swimmer_ref), (_resolve_team, team_ref)
+        )
 
     swimmer_id = swimmer["id"]
     team_id = team["id"]
@@ -1491,25 +1572,18 @@ def swimmers_assign(
     if start_date:
         payload["start_date"] = start_date
 
-    with console.status("Assigning swimmer to team..."):
+    with _status("Assigning swimmer to team..."):
         response = cli_auth.api_request("POST", f"/api/v1/swimmers/{swimmer_id}/teams", json_data=payload)
 
-    if response.status_code == 403:
-        console.print("[red]Admin or coach access required[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 404:
-        console.print("[red]Swimmer or team not found[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 409:
-        err = response.json()
-        console.print(f"[red]{err.get('detail', 'Already a member of this team')}[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code != 201:
-        console.print(f"[red]Error: {response.text}[/red]")
-        raise typer.Exit(1)
+    _check_status(
+        response,
+        201,
+        {
+            403: "Admin or coach access required",
+            404: "Swimmer or team not found",
+            409: "{detail}",
+        },
+    )
 
     console.print(f"[green]{swimmer_name} assigned to {team_name}[/green]")
 
@@ -1528,9 +1602,10 @@ def swimmers_unassign(
         raise typer.Exit(1) from None
 
     # Resolve swimmer and team
-    with console.status("Finding swimmer and team..."):
-        swimmer = _resolve_swimmer(swimmer_ref)
-        team = _resolve_team(team_ref)
+    with _status("Finding swimmer and team..."):
+        swimmer, team = _resolve_concurrently(
+            (_resolve_swimmer, swimmer_ref), (_resolve_team, team_ref)
+        )
 
     swimmer_id = swimmer["id"]
     team_id = team["id"]
@@ -1541,21 +1616,10 @@ def swimmers_unassign(
     if end_date:
         path += f"?end_date={end_date}"
 
-    with console.status("Ending team membership..."):
+    with _status("Ending team membership..."):
         response = cli_auth.api_request("DELETE", path)
 
-    if response.status_code == 403:
-        console.print("[red]Admin or coach access required[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code == 404:
-        err = response.json()
-        console.print(f"[red]{err.get('detail', 'Not a current member of this team')}[/red]")
-        raise typer.Exit(1)
-
-    if response.status_code != 200:
-        console.print(f"[red]Error: {response.text}[/red]")
-        raise typer.Exit(1)
+    _check_status(response, 200, {403: "Admin or coach access required", 404: "{detail}"})
 
     console.print(f"[green]{swimmer_name} removed from {team_name}[/green]")
 
@@ -1567,6 +1631,13 @@ def swimmers_unassign(
 meets_app = typer.Typer(help="Meet management", no_args_is_help=True)
 app.add_typer(meets_app, name="meets")
 
+_MEET_TYPE_COLORS = {
+    "championship": "green",
+    "invitational": "blue",
+    "dual": "yellow",
+    "time_trial": "dim",
+}
+
 
 def _resolve_meet(identifier: str) -> dict:
     """Resolve a meet by ID (partial UUID) or name.
@@ -1580,20 +1651,29 @@ def _resolve_meet(identifier: str) -> dict:
     Raises:
         typer.Exit: If meet not found or ambiguous
     """
-    import re
-
-    # Check if it looks like a UUID (hex chars, possibly with dashes)
-    is_uuid_like = bool(re.match(r'^[0-9a-f-]+$', identifier.lower()))
+    ident_lower = identifier.lower()
+    query = urlencode({"name": identifier, "limit": 10})
+    name_path = f"/api/v1/meets?{query}"
+    name_lookup = None
+
+    if _is_id_prefix(ident_lower):
+        # Try partial UUID match - the server returns only meets with this ID prefix.
+        # An ID-like identifier may still be a name, so the name lookup runs at the
+        # same time rather than after a miss. Both are cached briefly, since the
+        # same meet is often named in consecutive commands.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            id_lookup = pool.submit(
+                cli_auth.cached_get, f"/api/v1/meets?id_prefix={ident_lower}&limit=500"
+            )
+            name_lookup = pool.submit(cli_auth.cached_get, name_path)
 
-    if is_uuid_like and len(identifier.replace('-', '')) >= 8:
-        # Try partial UUID match - fetch all meets and filter
-        response = cli_auth.api_request("GET", "/api/v1/meets?limit=500")
-        if response.status_code != 200:
-            console.print(f"[red]Error fetching meets: {response.text}[/red]")
-            raise typer.Exit(1)
+        try:
+            meets = id_lookup.result()
+        except RuntimeError as e:
+            console.print(f"[red]Error fetching meets: {e}[/red]")
+            raise typer.Exit(1) from None
 
-        meets = response.json()
-        matches = [m for m in meets if m["id"].startswith(identifier.lower())]
+        matches = [m for m in meets if m["id"].startswith(ident_lower)]
 
         if len(matches) == 1:
             return matches[0]
@@ -1605,14 +1685,14 @@ def _resolve_meet(identifier: str) -> dict:
         # Fall through to try name match
 
     # Try exact name match
-    response = cli_auth.api_request("GET", f"/api/v1/meets?name={identifier}&limit=10")
-    if response.status_code != 200:
-        console.print(f"[red]Error searching meets: {response.text}[/red]")
-        raise typer.Exit(1)
+    try:
+        meets = name_lookup.result() if name_lookup else cli_auth.cached_get(name_path)
+    except RuntimeError as e:
+        console.print(f"[red]Error searching meets: {e}[/red]")
+        raise typer.Exit(1) from None
 
-    meets = response.json()
     # Look for exact name match (API does partial match)
-    exact_matches = [m for m in meets if m["name"].lower() == identifier.lower()]
+    exact_matches = [m for m in meets if m["name"].lower() == ident_lower]
 
     if len(exact_matches) == 1:
         return exact_matches[0]
@@ -1648,24 +1728,19 @@ def meets_list(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1) from None
 
-    # Build query params
-    params = []
-    if name:
-        params.append(f"name={name}")
-    if course:
-        params.append(f"course={course.lower()}")
-    if meet_type:
-        params.append(f"meet_type={meet_type}")
-    if after:
-        params.append(f"start_after={after}")
-    if before:
-        params.append(f"start_before={before}")
-    params.append(f"limit={limit}")
-
-    query = "&".join(params)
-    path = f"/api/v1/meets?{query}"
-
-    with console.status("Fetching meets..."):
+    # Build query params (urlencode escapes spaces, "&", etc. in names)
+    filters = {
+        "name": name,
+        "course": course and course.lower(),
+        "meet_type": meet_type,
+        "start_after": after,
+        "start_before": before,
+    }
+    params = {key: value for key, value in filters.items() if value}
+    params["limit"] = limit
+    path = f"/api/v1/meets?{urlencode(params)}"
+
+    with _status("Fetching meets..."):
         response = cli_auth.api_request("GET", path)
 
     if response.status_code != 200:
@@ -1686,19 +1761,15 @@ def meets_list(
     table.add_column("Type", no_wrap=True)
 
     for meet in meets:
-        type_color = {
-            "championship": "green",
-            "invitational": "blue",
-            "dual": "yellow",
-            "time_trial": "dim",
-        }.get(meet.get("meet_type", ""), "white")
-
         table.add_row(
             meet["id"][:8],
             meet["name"],
             meet.get("start_date", "-"),
             meet.get("course", "-").upper(),
-            f"[{type_color}]{meet.get('meet_type', '-')}[/{type_color}]",
+            Text(
+                meet.get("meet_type", "-"),
+                style=_MEET_TYPE_COLORS.get(meet.get("meet_type", ""), "white"),
+            ),
         )
 
     console.print(table)
@@ -1715,7 +1786,7 @@ def meets_get(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1) from None
 
-    with console.status("Fetching meet..."):
+    with _status("Fetching meet..."):
         meet = _resolve_meet(meet_ref)
 
     table = Table(title="Meet Details")
@@ -1776,7 +1847,7 @@ def meets_create(
     if state:
         payload["state"] = state
 
-    with console.status("Creating meet..."):
+    with _status("Creating meet..."):
         response = cli_auth.api_request("POST", "/api/v1/meets", json_data=payload)
 
     if response.status_code == 400:
@@ -1821,7 +1892,7 @@ def meets_update(
         raise typer.Exit(1) from None
 
     # Resolve meet first
-    with console.status("Finding meet..."):
+    with _status("Finding meet..."):
         meet = _resolve_meet(meet_ref)
     meet_id = meet["id"]
 
@@ -1843,7 +1914,7 @@ def meets_update(
         console.print("[yellow]No updates provided[/yellow]")
         raise typer.Exit(1)
 
-    with console.status("Updating meet..."):
+    with _status("Updating meet..."):
         response = cli_auth.api_request("PATCH", f"/api/v1/meets/{meet_id}", json_data=payload)
 
     if response.status_code == 404:
@@ -1881,7 +1952,7 @@ def meets_delete(
         raise typer.Exit(1) from None
 
     # Resolve meet first
-    with console.status("Finding meet..."):
+    with _status("Finding meet..."):
         meet = _resolve_meet(meet_ref)
     meet_id = meet["id"]
 
@@ -1889,7 +1960,7 @@ def meets_delete(
         console.print("[yellow]Cancelled[/yellow]")
         raise typer.Exit(0)
 
-    with console.status("Deleting meet..."):
+    with _status("Deleting meet..."):
         response = cli_auth.api_request("DELETE", f"/api/v1/meets/{meet_id}")
 
     if response.status_code == 403:
@@ -1915,12 +1986,12 @@ def meets_teams(
         raise typer.Exit(1) from None
 
     # Resolve meet first
-    with console.status("Finding meet..."):
+    with _status("Finding meet..."):
         meet = _resolve_meet(meet_ref)
     meet_id = meet["id"]
     meet_name = meet["name"]
 
-    with console.status("Fetching teams..."):
+    with _status("Fetching teams..."):
         response = cli_auth.api_request("GET", f"/api/v1/meets/{meet_id}/teams")
 
     if response.status_code != 200:
@@ -1938,7 +2009,7 @@ def meets_teams(
     table.add_column("Host", no_wrap=True)
 
     for team in teams:
-        host_status = "[green]Yes[/green]" if team.get("is_host") else "-"
+        host_status = Text("Yes", style="green") if team.get("is_host") else "-"
         table.add_row(
             team.get("team_name", "-"),
             host_status,
@@ -1961,9 +2032,8 @@ def meets_add_team(
         raise typer.Exit(1) from None
 
     # Resolve meet and team
-    with console.status("Finding meet and team..."):
-        meet = _resolve_meet(meet_ref)
-        team = _resolve_team(team_ref)
+    with _status("Finding meet and team..."):
+        meet, team = _resolve_concurrently((_resolve_meet, meet_ref), (_resolve_team, team_ref))
 
     meet_id = meet["id"]
     team_id = team["id"]
@@ -1972,7 +2042,7 @@ def meets_add_team(
 
     payload = {"team_id": team_id, "is_host": host}
 
-    with console.status("Adding team to meet..."):
+    with _status("Adding team to meet..."):
         response = cli_auth.api_request("POST", f"/api/v1/meets/{meet_id}/teams", json_data=payload)
 
     if response.status_code == 403:
@@ -2009,16 +2079,15 @@ def meets_remove_team(
         raise typer.Exit(1) from None
 
     # Resolve meet and team
-    with console.status("Finding meet and team..."):
-        meet = _resolve_meet(meet_ref)
-        team = _resolve_team(team_ref)
+    with _status("Finding meet and team..."):
+        meet, team = _resolve_concurrently((_resolve_meet, meet_ref), (_resolve_team, team_ref))
 
     meet_id = meet["id"]
     team_id = team["id"]
     meet_name = meet["name"]
     team_name = team["name"]
 
-    with console.status("Removing team from meet..."):
+    with _status("Removing team from meet..."):
         response = cli_auth.api_request("DELETE", f"/api/v1/meets/{meet_id}/teams/{team_id}")
 
     if response.status_code == 403:
@@ -2126,32 +2195,29 @@ def times_list(
         raise typer.Exit(1) from None
 
     # Build query params
-    params = []
-
-    # Resolve swimmer ID if provided
-    if swimmer:
-        with console.status("Finding swimmer..."):
-            swimmer_data = _resolve_swimmer(swimmer)
-        params.append(f"swimmer_id={swimmer_data['id']}")
-
-    # Resolve meet ID if provided
-    if meet:
-        with console.status("Finding meet..."):
-            meet_data = _resolve_meet(meet)
-        params.append(f"meet_id={meet_data['id']}")
-
-    # Resolve team ID if provided
-    if team:
-        with console.status("Finding team..."):
-            team_data = _resolve_team(team)
-        params.append(f"team_id={team_data['id']}")
-
-    params.append(f"limit={limit}")
+    params = {}
+
+    # Resolve whichever of swimmer, meet and team were provided, in parallel
+    lookups = {
+        param: (resolve, ref)
+        for param, resolve, ref in (
+            ("swimmer_id", _resolve_swimmer, swimmer),
+            ("meet_id", _resolve_meet, meet),
+            ("team_id", _resolve_team, team),
+        )
+        if ref
+    }
+    if lookups:
+        with _status("Resolving filters..."):
+            resolved = _resolve_concurrently(*lookups.values())
+        params.update(
+            (param, entity["id"]) for param, entity in zip(lookups, resolved, strict=True)
+        )
 
-    query = "&".join(params)
-    path = f"/api/v1/swim-times?{query}"
+    params["limit"] = limit
+    path = f"/api/v1/swim-times?{urlencode(params)}"
 
-    with console.status("Fetching times..."):
+    with _status("Fetching times..."):
         response = cli_auth.api_request("GET", path)
 
     if response.status_code != 200:
@@ -2208,10 +2274,10 @@ def times_record(
         raise typer.Exit(1) from None
 
     # Resolve swimmer, meet, team
-    with console.status("Resolving references..."):
-        swimmer_data = _resolve_swimmer(swimmer)
-        meet_data = _resolve_meet(meet)
-        team_data = _resolve_team(team)
+    with _status("Resolving references..."):
+        swimmer_data, meet_data, team_data = _resolve_concurrently(
+            (_resolve_swimmer, swimmer), (_resolve_meet, meet), (_resolve_team, team)
+        )
 
     swimmer_id = swimmer_data["id"]
     meet_id = meet_data["id"]
@@ -2258,13 +2324,13 @@ def times_pbs(
         raise typer.Exit(1) from None
 
     # Resolve swimmer
-    with console.status("Finding swimmer..."):
+    with _status("Finding swimmer..."):
         swimmer_data = _resolve_swimmer(swimmer)
 
     swimmer_id = swimmer_data["id"]
     swimmer_name = f"{swimmer_data['first_name']} {swimmer_data['last_name']}"
 
-    with console.status("Fetching personal bests..."):
+    with _status("Fetching personal bests..."):
         response = cli_auth.api_request("GET", f"/api/v1/swimmers/{swimmer_id}/personal-bests")
 
     if response.status_code == 404:
@@ -2305,7 +2371,7 @@ def times_compare(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1) from None
 
-    with console.status("Analyzing time..."):
+    with _status("Analyzing time..."):
         response = cli_auth.api_request("GET", f"/api/v1/swim-times/analysis/{time_id}")
 
     if response.status_code == 404:
@@ -2358,9 +2424,17 @@ def times_compare(
 users_app = typer.Typer(help="User management (admin only)", no_args_is_help=True)
 app.add_typer(users_app, name="users")
 
+_ROLE_COLORS = dict(zip(_ROLES, ("red", "blue", "green", "yellow"), strict=True))
+
 
 @users_app.command("list")
-def users_list():
+def users_list(
+    limit: int = typer.Option(50, "--limit", min=1, help="Max rows to display"),
+    plain: bool = typer.Option(
+        False, "--plain", help="Tab-separated output without table formatting"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Output users as JSON"),
+):
     """List all users."""
     try:
         cli_auth.require_admin()
@@ -2368,7 +2442,7 @@ def users_list():
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1) from None
 
-    with console.status("Fetching users..."):
+    with _status("Fetching users..."):
         response = cli_auth.api_request("GET", "/api/v1/auth/users")
 
     if response.status_code == 403:
@@ -2385,26 +2459,43 @@ def users_list():
         console.print("[yellow]No users found[/yellow]")
         return
 
+    if as_json:
+        typer.echo(cli_auth.json_dumps(users[:limit], indent=True).decode())
+        if len(users) > limit:
+            typer.echo(f"... and {len(users) - limit} more users", err=True)
+        return
+
+    if plain:
+        # One write, no per-cell layout; suited to large lists and piping
+        lines = ["ID\tDisplay Name\tRole"]
+        lines.extend(
+            f"{user['id'][:8]}\t{user.get('display_name') or '-'}\t{user['role']}"
+            for user in users[:limit]
+        )
+        typer.echo("\n".join(lines))
+        if len(users) > limit:
+            typer.echo(f"... and {len(users) - limit} more users", err=True)
+        return
+
     table = Table(title=f"Users ({len(users)})")
     table.add_column("ID", style="dim", no_wrap=True)
     table.add_column("Display Name", style="cyan", no_wrap=True)
     table.add_column("Role", no_wrap=True)
 
-    for user in users:
-        role_color = {
-            "admin": "red",
-            "coach": "blue",
-            "swimmer": "green",
-            "fan": "yellow",
-        }.get(user["role"], "white")
-
-        table.add_row(
+    rows = [
+        (
             user["id"][:8],
             user.get("display_name", "-"),
-            f"[{role_color}]{user['role']}[/{role_color}]",
+            Text(user["role"], style=_ROLE_COLORS.get(user["role"], "white")),
         )
+        for user in users[:limit]
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
+    if len(users) > limit:
+        console.print(f"[dim]... and {len(users) - limit} more users[/dim]")
 
 
 def main():
@@ -1,25 +1,40 @@
 """CLI authentication - login, logout, and token management.
 
 Tokens are stored in ~/.swimcuttimes/credentials.json
+Short-lived API list responses are cached in ~/.swimcuttimes/cache.json
 """
 
+import atexit
+import base64
 import contextlib
+import importlib.util
 import json
-from datetime import datetime
+import threading
+import time
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import httpx
 from pydantic import BaseModel
-from rich.console import Console
 
 from swimcuttimes.config import get_settings
 
-console = Console()
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install swimcuttimes[fast]
+    orjson = None
 
 # Config directory
 CONFIG_DIR = Path.home() / ".swimcuttimes"
 CREDENTIALS_FILE = CONFIG_DIR / "credentials.json"
+CACHE_FILE = CONFIG_DIR / "cache.json"
+
+# How long a cached GET response may be reused (seconds)
+CACHE_TTL = 120
+
+# Refresh the access token when it expires within this window
+TOKEN_REFRESH_MARGIN = timedelta(seconds=60)
 
 
 class StoredCredentials(BaseModel):
@@ -34,6 +49,18 @@ class StoredCredentials(BaseModel):
     expires_at: datetime | None = None
 
 
+# Credentials loaded by this process (avoids re-reading the file per request)
+_credentials: StoredCredentials | None = None
+
+# Response cache loaded by this process: {url: {"fetched_at": epoch, "data": ...}}
+_cache: dict[str, dict[str, Any]] | None = None
+_cache_lock = threading.RLock()
+
+# Shared HTTP client so consecutive requests reuse one keep-alive connection
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
 def get_api_url() -> str:
     """Get API base URL from settings."""
     settings = get_settings()
@@ -49,29 +76,51 @@ def _ensure_config_dir() -> None:
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _token_expiry(access_token: str) -> datetime | None:
+    """Read the ``exp`` claim from a JWT without verifying its signature."""
+    try:
+        payload = access_token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return datetime.fromtimestamp(claims["exp"], tz=UTC)
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
 def save_credentials(creds: StoredCredentials) -> None:
     """Save credentials to file."""
+    global _credentials
+
     _ensure_config_dir()
     CREDENTIALS_FILE.write_text(creds.model_dump_json(indent=2))
     # Secure permissions (owner read/write only)
     CREDENTIALS_FILE.chmod(0o600)
+    _credentials = creds
 
 
 def load_credentials() -> StoredCredentials | None:
-    """Load credentials from file."""
+    """Load credentials from file (cached for the rest of the process)."""
+    global _credentials
+
+    if _credentials is not None:
+        return _credentials
     if not CREDENTIALS_FILE.exists():
         return None
     try:
         data = json.loads(CREDENTIALS_FILE.read_text())
-        return StoredCredentials(**data)
+        _credentials = StoredCredentials(**data)
     except (json.JSONDecodeError, ValueError):
         return None
+    return _credentials
 
 
 def clear_credentials() -> None:
-    """Remove stored credentials."""
+    """Remove stored credentials (and the response cache, which is per-user)."""
+    global _credentials
+
+    _credentials = None
     if CREDENTIALS_FILE.exists():
         CREDENTIALS_FILE.unlink()
+    clear_cache()
 
 
 def is_logged_in() -> bool:
@@ -79,6 +128,145 @@ def is_logged_in() -> bool:
     return load_credentials() is not None
 
 
+def json_loads(data: bytes | str) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any, *, indent: bool = False) -> bytes:
+    """Encode JSON to bytes, using orjson when it is installed.
+
+    Args:
+        data: Value to encode
+        indent: Pretty-print with 2-space indentation (for files meant to be read)
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+class APIResponse:
+    """Thin wrapper around httpx.Response whose json() uses the fast decoder."""
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    def json(self) -> Any:
+        """Decode the response body as JSON."""
+        return json_loads(self._response.content)
+
+
+def _get_client() -> httpx.Client:
+    """Get the process-wide HTTP client, creating it on first use."""
+    global _client
+
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                base_url=get_api_url(),
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                timeout=30,
+            )
+            atexit.register(_client.close)
+    return _client
+
+
+def _load_cache() -> dict[str, dict[str, Any]]:
+    """Load the response cache from file (once per process)."""
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = json_loads(CACHE_FILE.read_bytes())
+            except (OSError, ValueError):
+                _cache = {}
+        return _cache
+
+
+def _save_cache() -> None:
+    """Write the response cache to file."""
+    _ensure_config_dir()
+    with _cache_lock:
+        CACHE_FILE.write_bytes(json_dumps(_load_cache()))
+        CACHE_FILE.chmod(0o600)
+
+
+def clear_cache() -> None:
+    """Drop all cached responses."""
+    global _cache
+
+    with _cache_lock:
+        _cache = {}
+        CACHE_FILE.unlink(missing_ok=True)
+
+
+def invalidate_cache(path: str) -> None:
+    """Drop cached responses for the collection a path belongs to.
+
+    e.g. "/api/v1/teams/<id>" invalidates "/api/v1/teams?limit=500".
+    """
+    collection = get_api_url() + "/".join(path.split("?", 1)[0].split("/", 4)[:4])
+    with _cache_lock:
+        cache = _load_cache()
+        stale = [key for key in cache if key.startswith(collection)]
+        if stale:
+            for key in stale:
+                del cache[key]
+            _save_cache()
+
+
+def cached_get(path: str) -> Any:
+    """GET a path and decode it, reusing a response cached within CACHE_TTL.
+
+    Used by the CLI resolvers, which look up the same entities across
+    consecutive commands. Any non-GET request made through api_request()
+    invalidates the cached responses of that collection. Empty results are
+    not cached, so a record created elsewhere is found on the next lookup.
+    Safe to call from worker threads.
+
+    Args:
+        path: API path including query string
+
+    Returns:
+        Decoded JSON body
+
+    Raises:
+        RuntimeError: If not logged in or the response is not 200
+    """
+    key = get_api_url() + path
+    with _cache_lock:
+        entry = _load_cache().get(key)
+    if entry and time.time() - entry["fetched_at"] < CACHE_TTL:
+        return entry["data"]
+
+    response = api_request("GET", path)
+    if response.status_code != 200:
+        raise RuntimeError(response.text)
+
+    data = response.json()
+    if not data:
+        return data
+
+    now = time.time()
+    with _cache_lock:
+        cache = _load_cache()
+        # Drop expired entries so the file only holds what can still be used
+        for stale in [k for k, e in cache.items() if now - e["fetched_at"] >= CACHE_TTL]:
+            del cache[stale]
+        cache[key] = {"fetched_at": now, "data": data}
+        _save_cache()
+    return data
+
+
 def get_auth_headers() -> dict[str, str]:
     """Get authorization headers for API requests."""
     creds = load_credentials()
@@ -93,7 +281,7 @@ def api_request(
     *,
     json_data: dict[str, Any] | None = None,
     auth: bool = True,
-) -> httpx.Response:
+) -> APIResponse:
     """Make an API request.
 
     Args:
@@ -103,19 +291,21 @@ def api_request(
         auth: Include auth headers (default: True)
 
     Returns:
-        Response object
+        Response object (httpx.Response with an orjson-backed json())
 
     Raises:
         RuntimeError: If not logged in and auth=True
         httpx.HTTPStatusError: If response is 4xx/5xx
     """
-    url = f"{get_api_url()}{path}"
     headers = get_auth_headers() if auth else {}
-
-    with httpx.Client() as client:
-        response = client.request(method, url, json=json_data, headers=headers, timeout=30)
-
-    return response
+    content = None
+    if json_data is not None:
+        content = json_dumps(json_data)
+        headers["Content-Type"] = "application/json"
+    response = _get_client().request(method, path, content=content, headers=headers)
+    if method != "GET":
+        invalidate_cache(path)
+    return APIResponse(response)
 
 
 def login(email: str, password: str) -> StoredCredentials:
@@ -153,8 +343,10 @@ def login(email: str, password: str) -> StoredCredentials:
         email=email,
         role=data["user"]["role"],
         display_name=data["user"].get("display_name"),
+        expires_at=_token_expiry(data["access_token"]),
     )
 
+    clear_cache()
     save_credentials(creds)
     return creds
 
@@ -199,6 +391,7 @@ def refresh_token() -> StoredCredentials | None:
             email=creds.email,
             role=data["user"]["role"],
             display_name=data["user"].get("display_name"),
+            expires_at=_token_expiry(data["access_token"]),
         )
 
         save_credentials(new_creds)
@@ -226,6 +419,9 @@ def get_current_user() -> dict[str, Any] | None:
 def require_auth() -> StoredCredentials:
     """Require authentication, raising error if not logged in.
 
+    Credentials are read from disk once per process. The API is only
+    contacted when the access token is about to expire, to refresh it.
+
     Returns:
         Current credentials
 
@@ -235,6 +431,10 @@ def require_auth() -> StoredCredentials:
     creds = load_credentials()
     if not creds:
         raise RuntimeError("Not logged in. Run: swimcuttimes auth login")
+
+    expires_at = creds.expires_at or _token_expiry(creds.access_token)
+    if expires_at and expires_at - datetime.now(UTC) < TOKEN_REFRESH_MARGIN:
+        creds = refresh_token() or creds
     return creds
 
 
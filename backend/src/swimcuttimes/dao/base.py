@@ -10,6 +10,32 @@ from supabase import Client, create_client
 T = TypeVar("T", bound=BaseModel)
 
 
+def escape_like(value: str) -> str:
+    """Escape LIKE/ILIKE wildcards so the value matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def uuid_prefix_bounds(prefix: str) -> tuple[str, str]:
+    """Return the lowest and highest UUIDs starting with a hex prefix.
+
+    UUID columns can't be LIKE-matched, but a prefix is a contiguous range,
+    so filtering with gte/lte on these bounds finds the same rows via the
+    primary key index.
+
+    Args:
+        prefix: Leading hex digits of a UUID, dashes optional
+
+    Raises:
+        ValueError: If the prefix is not hex or longer than a UUID
+    """
+    digits = prefix.replace("-", "").lower()
+    if len(digits) > 32 or not all(c in "0123456789abcdef" for c in digits):
+        raise ValueError(f"Invalid UUID prefix: {prefix!r}")
+    low = UUID(digits.ljust(32, "0"))
+    high = UUID(digits.ljust(32, "f"))
+    return str(low), str(high)
+
+
 class SupabaseClient:
     """Singleton Supabase client manager."""
 
@@ -72,6 +98,15 @@ class BaseDAO(Generic[T]):
 
         return self._to_model(result.data[0])
 
+    def _filter_id_prefix(self, query, id_prefix: str):
+        """Restrict a query to rows whose ID starts with a hex prefix.
+
+        Raises:
+            ValueError: If the prefix is not hex or longer than a UUID
+        """
+        low, high = uuid_prefix_bounds(id_prefix)
+        return query.gte("id", low).lte("id", high)
+
     def get_all(self, limit: int = 100, offset: int = 0) -> list[T]:
         """Get all records with pagination.
 
@@ -134,6 +134,7 @@ class MeetDAO(BaseDAO[Meet]):
         start_before: date | None = None,
         indoor: bool | None = None,
         limit: int = 100,
+        id_prefix: str | None = None,
     ) -> list[Meet]:
         """Search meets with multiple filters.
 
@@ -146,12 +147,18 @@ class MeetDAO(BaseDAO[Meet]):
             start_before: Only meets starting before this date
             indoor: Filter by indoor/outdoor
             limit: Maximum results
+            id_prefix: Leading hex digits of the meet ID
 
         Returns:
             List of matching Meets
+
+        Raises:
+            ValueError: If id_prefix is not a valid UUID prefix
         """
         query = self.table.select("*")
 
+        if id_prefix:
+            query = self._filter_id_prefix(query, id_prefix)
         if name:
             query = query.ilike("name", f"%{name}%")
         if course:
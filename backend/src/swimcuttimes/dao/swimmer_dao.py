@@ -5,10 +5,35 @@ from uuid import UUID
 
 from supabase import Client
 
-from swimcuttimes.dao.base import BaseDAO
+from swimcuttimes.dao.base import BaseDAO, escape_like
 from swimcuttimes.models.swimmer import Gender, Swimmer
 
 
+def _exact_name_filter(name: str) -> str:
+    """Build a PostgREST or-filter matching a swimmer name exactly (case-insensitive).
+
+    Accepts "First Last", "Last, First" or just the last name. Multi-word
+    names are tried split at every space, e.g. "Mary Ann Van Dyke".
+    """
+
+    def cond(column: str, value: str) -> str:
+        # Backslash is an escape character inside a double-quoted PostgREST
+        # value, so double it to keep escape_like's \% and \_ for LIKE
+        value = escape_like(value.strip()).replace("\\", "\\\\").replace('"', '\\"')
+        return f'{column}.ilike."{value}"'
+
+    conditions = [cond("last_name", name)]
+    if "," in name:
+        last, first = name.split(",", 1)
+        conditions.append(f"and({cond('first_name', first)},{cond('last_name', last)})")
+    else:
+        parts = name.split()
+        for i in range(1, len(parts)):
+            first, last = " ".join(parts[:i]), " ".join(parts[i:])
+            conditions.append(f"and({cond('first_name', first)},{cond('last_name', last)})")
+    return ",".join(conditions)
+
+
 class SwimmerDAO(BaseDAO[Swimmer]):
     """DAO for Swimmer entities."""
 
@@ -159,6 +184,9 @@ class SwimmerDAO(BaseDAO[Swimmer]):
         min_age: int | None = None,
         max_age: int | None = None,
         limit: int = 100,
+        name_exact: bool = False,
+        id_prefix: str | None = None,
+        usa_swimming_id: str | None = None,
     ) -> list[Swimmer]:
         """Search swimmers with multiple filters.
 
@@ -168,13 +196,26 @@ class SwimmerDAO(BaseDAO[Swimmer]):
             min_age: Minimum age filter
             max_age: Maximum age filter
             limit: Maximum results
+            name_exact: Match "First Last", "Last, First" or the last name exactly
+            id_prefix: Leading hex digits of the swimmer ID
+            usa_swimming_id: Exact USA Swimming ID
 
         Returns:
             List of matching Swimmers
+
+        Raises:
+            ValueError: If id_prefix is not a valid UUID prefix
         """
         query = self.table.select("*")
 
-        if name:
+        if id_prefix:
+            query = self._filter_id_prefix(query, id_prefix)
+        if usa_swimming_id:
+            query = query.eq("usa_swimming_id", usa_swimming_id)
+
+        if name and name_exact:
+            query = query.or_(_exact_name_filter(name))
+        elif name:
             # Search in both first and last name
             query = query.or_(f"first_name.ilike.%{name}%,last_name.ilike.%{name}%")
 
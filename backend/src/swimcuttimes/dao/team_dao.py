@@ -5,7 +5,7 @@ from uuid import UUID
 
 from supabase import Client
 
-from swimcuttimes.dao.base import BaseDAO
+from swimcuttimes.dao.base import BaseDAO, escape_like
 from swimcuttimes.models.team import SwimmerTeam, Team, TeamType
 
 
@@ -101,6 +101,8 @@ class TeamDAO(BaseDAO[Team]):
         country: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        name_exact: bool = False,
+        id_prefix: str | None = None,
     ) -> list[Team]:
         """Search teams with optional filters.
 
@@ -114,14 +116,22 @@ class TeamDAO(BaseDAO[Team]):
             country: Filter by country
             limit: Maximum results to return
             offset: Number of results to skip
+            name_exact: Match the whole name instead of a substring
+            id_prefix: Leading hex digits of the team ID
 
         Returns:
             List of matching Teams
+
+        Raises:
+            ValueError: If id_prefix is not a valid UUID prefix
         """
         query = self.table.select("*")
 
+        if id_prefix:
+            query = self._filter_id_prefix(query, id_prefix)
         if name:
-            query = query.ilike("name", f"%{name}%")
+            pattern = escape_like(name) if name_exact else f"%{name}%"
+            query = query.ilike("name", pattern)
         if team_type:
             query = query.eq("team_type", team_type.value)
         if sanctioning_body:
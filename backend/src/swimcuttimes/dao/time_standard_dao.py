@@ -228,6 +228,35 @@ class TimeStandardDAO(BaseDAO[TimeStandard]):
 
         return self.create(ts)
 
+    def bulk_create(self, models: list[TimeStandard]) -> list[TimeStandard]:
+        """Create many time standards with a single insert.
+
+        Events are resolved once per distinct stroke/distance/course (created
+        if missing). The standards are inserted in one statement, so either
+        all of them are created or none are; events created beforehand are
+        kept even if the insert fails.
+
+        Returns:
+            The created TimeStandards, in input order, with IDs populated
+        """
+        if not models:
+            return []
+
+        events: dict[tuple, Event] = {}
+        prepared: list[TimeStandard] = []
+        for model in models:
+            key = (model.event.stroke, model.event.distance, model.event.course)
+            if key not in events:
+                events[key] = self.event_dao.find_or_create(*key)
+            prepared.append(model.model_copy(update={"event": events[key]}))
+
+        result = self.table.insert([self._to_db(model) for model in prepared]).execute()
+
+        return [
+            model.model_copy(update={"id": UUID(row["id"])})
+            for model, row in zip(prepared, result.data, strict=True)
+        ]
+
     def create(self, model: TimeStandard) -> TimeStandard:
         """Create a new time standard.
 
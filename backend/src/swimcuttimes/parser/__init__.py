@@ -6,7 +6,6 @@ from swimcuttimes.parser.converter import (
     parse_qualifying_date,
 )
 from swimcuttimes.parser.schemas import ParsedTimeEntry, ParsedTimeStandardSheet
-from swimcuttimes.parser.vision_parser import TimeStandardParser
 
 __all__ = [
     # Parser
@@ -19,3 +18,13 @@ __all__ = [
     "convert_sheet_to_time_standards",
     "parse_qualifying_date",
 ]
+
+
+def __getattr__(name: str):
+    # TimeStandardParser pulls in the Anthropic SDK (~1s to import); load it only
+    # when it is actually used, so converting already-parsed JSON stays fast.
+    if name == "TimeStandardParser":
+        from swimcuttimes.parser.vision_parser import TimeStandardParser
+
+        return TimeStandardParser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
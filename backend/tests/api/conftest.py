@@ -130,3 +130,9 @@ def client_as_coach(coach_user: UserProfile) -> TestClient:
     # Note: require_admin is NOT overridden, so admin-only routes will fail
 
     return TestClient(app)
+
+
+@pytest.fixture
+def service_supabase() -> Client:
+    """Provide a service_role Supabase client for cleaning up rows with no delete route."""
+    return _get_test_supabase_client()
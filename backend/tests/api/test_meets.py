@@ -152,6 +152,13 @@ class TestMeetCRUD:
             assert any(m["id"] == meet2_id for m in meets)
             assert not any(m["id"] == meet1_id for m in meets)
 
+            # Filter by leading characters of the ID
+            response = client_as_admin.get("/api/v1/meets", params={"id_prefix": meet1_id[:8]})
+            assert response.status_code == 200
+            meets = response.json()
+            assert any(m["id"] == meet1_id for m in meets)
+            assert all(m["id"].startswith(meet1_id[:8]) for m in meets)
+
         finally:
             # Cleanup
             client_as_admin.delete(f"/api/v1/meets/{meet1_id}")
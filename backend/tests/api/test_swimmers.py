@@ -119,6 +119,23 @@ class TestSwimmerCRUD:
             results = response.json()
             assert all(10 <= s["age"] <= 14 for s in results)
 
+            # Exact full-name match ("First Last" and "Last, First")
+            for name in ["alice testfilter", "TestFilter, Alice"]:
+                response = client_as_admin.get(
+                    "/api/v1/swimmers", params={"name": name, "name_exact": True}
+                )
+                assert response.status_code == 200
+                results = response.json()
+                assert [s["id"] for s in results] == [swimmers[0]["id"]]
+
+            # Filter by leading characters of the ID
+            prefix = swimmers[1]["id"][:8]
+            response = client_as_admin.get("/api/v1/swimmers", params={"id_prefix": prefix})
+            assert response.status_code == 200
+            results = response.json()
+            assert swimmers[1]["id"] in [s["id"] for s in results]
+            assert all(s["id"].startswith(prefix) for s in results)
+
         finally:
             # Cleanup
             for swimmer in swimmers:
@@ -127,6 +127,60 @@ class TestTeamCRUD:
         # Cleanup
         client_as_admin.delete(f"/api/v1/teams/{team_id}")
 
+    def test_list_teams_name_exact(self, client_as_admin: TestClient):
+        """Test exact (case-insensitive) name filter skips partial matches."""
+        created = []
+        for name in ["Exact Match Club", "Exact Match Club Juniors"]:
+            response = client_as_admin.post(
+                "/api/v1/teams",
+                json={
+                    "name": name,
+                    "team_type": "club",
+                    "sanctioning_body": "USA Swimming",
+                    "lsc": "NE",
+                },
+            )
+            assert response.status_code == 201
+            created.append(response.json()["id"])
+
+        try:
+            response = client_as_admin.get(
+                "/api/v1/teams", params={"name": "exact match club", "name_exact": True}
+            )
+            assert response.status_code == 200
+            teams = response.json()
+            assert [t["name"] for t in teams] == ["Exact Match Club"]
+
+        finally:
+            for team_id in created:
+                client_as_admin.delete(f"/api/v1/teams/{team_id}")
+
+    def test_list_teams_id_prefix(self, client_as_admin: TestClient):
+        """Test filtering teams by leading characters of the ID."""
+        response = client_as_admin.post(
+            "/api/v1/teams",
+            json={
+                "name": "ID Prefix Club",
+                "team_type": "club",
+                "sanctioning_body": "USA Swimming",
+                "lsc": "NE",
+            },
+        )
+        assert response.status_code == 201
+        team_id = response.json()["id"]
+
+        try:
+            response = client_as_admin.get("/api/v1/teams", params={"id_prefix": team_id[:8]})
+            assert response.status_code == 200
+            assert team_id in [t["id"] for t in response.json()]
+            assert all(t["id"].startswith(team_id[:8]) for t in response.json())
+
+            response = client_as_admin.get("/api/v1/teams", params={"id_prefix": "not-hex"})
+            assert response.status_code == 422
+
+        finally:
+            client_as_admin.delete(f"/api/v1/teams/{team_id}")
+
     def test_duplicate_team_name_rejected(self, client_as_admin: TestClient):
         """Test that creating a team with a duplicate name returns 409."""
         create_payload = {
@@ -0,0 +1,85 @@
+"""Tests for TimeStandard API endpoints."""
+
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from supabase import Client
+
+from swimcuttimes.config import get_settings
+
+# Skip tests if service_role key is not configured (RLS blocks operations)
+pytestmark = pytest.mark.skipif(
+    get_settings().supabase_service_role_key is None,
+    reason="SUPABASE_SERVICE_ROLE_KEY not configured - tests require service role to bypass RLS",
+)
+
+
+def _standard(standard_name: str, cut_level: str, event: dict, time_centiseconds: int) -> dict:
+    return {
+        "event": event,
+        "gender": "F",
+        "age_group": "15-18",
+        "standard_name": standard_name,
+        "cut_level": cut_level,
+        "sanctioning_body": "Test Body",
+        "time_centiseconds": time_centiseconds,
+        "effective_year": 2026,
+    }
+
+
+class TestTimeStandardBulkCreate:
+    """Test creating many time standards in one request."""
+
+    def test_bulk_create_time_standards(
+        self, client_as_admin: TestClient, service_supabase: Client
+    ):
+        """Test that every standard in the request is created."""
+        standard_name = f"Bulk Test {uuid.uuid4().hex[:8]}"
+        event = {"stroke": "freestyle", "distance": 100, "course": "scy"}
+        payload = {
+            "standards": [
+                _standard(standard_name, "Cut", event, 5500),
+                _standard(standard_name, "Cut Off", event, 5800),
+            ]
+        }
+
+        response = client_as_admin.post("/api/v1/time-standards/bulk", json=payload)
+        assert response.status_code == 201, response.text
+        created = response.json()
+
+        try:
+            assert len(created) == 2
+            assert all(ts["id"] is not None for ts in created)
+            assert [ts["cut_level"] for ts in created] == ["Cut", "Cut Off"]
+            assert created[0]["event"]["id"] == created[1]["event"]["id"]
+        finally:
+            service_supabase.table("time_standards").delete().in_(
+                "id", [ts["id"] for ts in created]
+            ).execute()
+
+    def test_bulk_create_invalid_event_rejected(
+        self, client_as_admin: TestClient, service_supabase: Client
+    ):
+        """Test that an invalid event returns 400 and creates no standards."""
+        standard_name = f"Bulk Invalid {uuid.uuid4().hex[:8]}"
+        valid_event = {"stroke": "freestyle", "distance": 100, "course": "lcm"}
+        # 500 is a yards distance, not valid for LCM freestyle
+        invalid_event = {"stroke": "freestyle", "distance": 500, "course": "lcm"}
+        payload = {
+            "standards": [
+                _standard(standard_name, "Cut", valid_event, 5500),
+                _standard(standard_name, "Cut", invalid_event, 30000),
+            ]
+        }
+
+        response = client_as_admin.post("/api/v1/time-standards/bulk", json=payload)
+        assert response.status_code == 400, response.text
+
+        result = (
+            service_supabase.table("time_standards")
+            .select("id")
+            .eq("standard_name", standard_name)
+            .execute()
+        )
+        assert result.data == []
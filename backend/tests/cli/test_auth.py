@@ -0,0 +1,95 @@
+"""Tests for the CLI response cache."""
+
+import pytest
+
+from swimcuttimes.cli import auth as cli_auth
+
+
+class FakeResponse:
+    """Minimal stand-in for an API response."""
+
+    def __init__(self, data):
+        self.status_code = 200
+        self.text = ""
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+@pytest.fixture
+def responses(monkeypatch, tmp_path):
+    """Route cached_get to a fresh cache file and canned API responses."""
+    data: dict[str, list] = {}
+    calls: list[str] = []
+
+    def fake_request(method, path, **kwargs):
+        calls.append(path)
+        return FakeResponse(data[path])
+
+    monkeypatch.setattr(cli_auth, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(cli_auth, "CACHE_FILE", tmp_path / "cache.json")
+    monkeypatch.setattr(cli_auth, "_cache", None)
+    monkeypatch.setattr(cli_auth, "get_api_url", lambda: "http://api.test")
+    monkeypatch.setattr(cli_auth, "api_request", fake_request)
+    return data, calls
+
+
+class TestCachedGet:
+    """Test the TTL cache used by the CLI resolvers."""
+
+    def test_reuses_cached_response(self, responses):
+        """Test that a repeated GET within the TTL is served from the cache."""
+        data, calls = responses
+        data["/api/v1/meets?name=Open"] = [{"id": "m1", "name": "Open"}]
+
+        assert cli_auth.cached_get("/api/v1/meets?name=Open") == [{"id": "m1", "name": "Open"}]
+        assert cli_auth.cached_get("/api/v1/meets?name=Open") == [{"id": "m1", "name": "Open"}]
+        assert calls == ["/api/v1/meets?name=Open"]
+
+    def test_expired_entry_pruned_without_clobbering_new_entry(self, responses, monkeypatch):
+        """Test that pruning expired entries stores each URL's own data."""
+        data, calls = responses
+        data["/api/v1/meets?name=Open"] = [{"id": "m1", "name": "Open"}]
+        data["/api/v1/swimmers?id_prefix=bbbbbbbb"] = [{"id": "s1", "last_name": "B"}]
+
+        now = 1_000_000.0
+        monkeypatch.setattr(cli_auth.time, "time", lambda: now)
+        cli_auth.cached_get("/api/v1/meets?name=Open")
+
+        # Let the meet entry expire, then cache a different URL
+        now += cli_auth.CACHE_TTL + 1
+        cli_auth.cached_get("/api/v1/swimmers?id_prefix=bbbbbbbb")
+
+        # Reload from disk to check what was persisted
+        cli_auth._cache = None
+        cache = cli_auth._load_cache()
+        assert list(cache) == ["http://api.test/api/v1/swimmers?id_prefix=bbbbbbbb"]
+        assert cli_auth.cached_get("/api/v1/swimmers?id_prefix=bbbbbbbb") == [
+            {"id": "s1", "last_name": "B"}
+        ]
+        assert cli_auth.cached_get("/api/v1/meets?name=Open") == [{"id": "m1", "name": "Open"}]
+        assert calls == [
+            "/api/v1/meets?name=Open",
+            "/api/v1/swimmers?id_prefix=bbbbbbbb",
+            "/api/v1/meets?name=Open",
+        ]
+
+    def test_empty_results_not_cached(self, responses):
+        """Test that an empty result is fetched again on the next lookup."""
+        data, calls = responses
+        data["/api/v1/teams?name=New"] = []
+
+        assert cli_auth.cached_get("/api/v1/teams?name=New") == []
+        assert cli_auth.cached_get("/api/v1/teams?name=New") == []
+        assert len(calls) == 2
+
+    def test_write_invalidates_collection(self, responses):
+        """Test that invalidate_cache drops cached entries of the same collection."""
+        data, calls = responses
+        data["/api/v1/teams?name=Sharks"] = [{"id": "t1", "name": "Sharks"}]
+
+        cli_auth.cached_get("/api/v1/teams?name=Sharks")
+        cli_auth.invalidate_cache("/api/v1/teams/t1")
+        cli_auth.cached_get("/api/v1/teams?name=Sharks")
+        assert len(calls) == 2
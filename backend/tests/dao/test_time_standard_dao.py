@@ -1,6 +1,6 @@
 """Smoke tests for TimeStandardDAO."""
 
-from swimcuttimes.models import Course, Gender, Stroke
+from swimcuttimes.models import Course, Event, Gender, Stroke, TimeStandard
 
 
 class TestTimeStandardDAO:
@@ -65,3 +65,30 @@ class TestTimeStandardDAO:
         # time_formatted should be a string like "54.49" or "1:05.79"
         assert isinstance(ts.time_formatted, str)
         assert "." in ts.time_formatted  # Should have decimal
+
+    def test_bulk_create_inserts_all_rows(self, time_standard_dao):
+        """Verify bulk_create inserts every standard and resolves shared events once."""
+        standards = [
+            TimeStandard(
+                event=Event(stroke=Stroke.BUTTERFLY, distance=50, course=Course.SCY),
+                gender=gender,
+                age_group="10-under",
+                standard_name="Bulk Test",
+                cut_level="Cut Time",
+                sanctioning_body="Bulk Test Body",
+                time_centiseconds=3599,
+                effective_year=2025,
+            )
+            for gender in (Gender.MALE, Gender.FEMALE)
+        ]
+
+        created = time_standard_dao.bulk_create(standards)
+        try:
+            assert len(created) == 2
+            assert all(ts.id is not None for ts in created)
+            assert [ts.gender for ts in created] == [Gender.MALE, Gender.FEMALE]
+            assert created[0].event.id is not None
+            assert created[0].event.id == created[1].event.id
+        finally:
+            for ts in created:
+                time_standard_dao.delete(ts.id)